@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Tests import the package as `src.*`; with --import-mode=importlib pytest no longer
+# puts the repository root on sys.path, so add it once here
+ROOT = str(Path(__file__).parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,66 @@
+from typing import List
+import numpy as np
+
+# Two bits per base; the first base of a k-mer is the most significant
+MAX_K = 31  # Longest k-mer that fits in a uint64 without clashing with GAP_CODE
+GAP_CODE = (1 << 64) - 1  # Sentinel for k-mers containing gaps ('N') or other symbols
+
+_BASES = 'ACGT'
+_BASE_CODES = {base: i for i, base in enumerate(_BASES)}
+
+_LUT = np.full(256, 255, dtype=np.uint8)
+for _i, _base in enumerate(_BASES):
+    _LUT[ord(_base)] = _i
+
+
+def encode(kmer: str) -> int:
+    """Pack a k-mer into an integer, two bits per base"""
+    code = 0
+    for base in kmer:
+        value = _BASE_CODES.get(base)
+        if value is None:
+            return GAP_CODE
+        code = (code << 2) | value
+    return code
+
+
+def decode(code: int, k: int) -> str:
+    """Unpack an integer code back into a k-mer"""
+    return ''.join(_BASES[(code >> (2 * i)) & 3] for i in range(k - 1, -1, -1))
+
+
+def prefix(code: int, k: int) -> int:
+    """Code of the first k-1 bases of a k-mer"""
+    return code >> 2
+
+
+def suffix(code: int, k: int) -> int:
+    """Code of the last k-1 bases of a k-mer"""
+    return code & ((1 << (2 * (k - 1))) - 1)
+
+
+def encode_array(kmers: List[str], k: int) -> np.ndarray:
+    """Pack equal-length k-mers into a uint64 array in a single vectorized pass"""
+    if k > MAX_K:
+        raise ValueError(f"k-mers longer than {MAX_K} do not fit in uint64 codes")
+    if not kmers:
+        return np.empty(0, dtype=np.uint64)
+    
+    values = _LUT[np.frombuffer(''.join(kmers).encode('ascii'), dtype=np.uint8)].reshape(len(kmers), k)
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    codes = (values.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+    codes[(values == 255).any(axis=1)] = GAP_CODE
+    
+    return codes
+
+
+_POPCOUNT4 = np.array([bin(mask).count('1') for mask in range(16)], dtype=np.uint8)
+
+
+def distinct_bases(codes: np.ndarray, k: int) -> np.ndarray:
+    """Count distinct bases in each coded k-mer via a 4-bit presence mask"""
+    presence = np.zeros(codes.shape, dtype=np.uint8)
+    for i in range(k):
+        bases = ((codes >> np.uint64(2 * i)) & np.uint64(3)).astype(np.uint8)
+        presence |= np.left_shift(np.uint8(1), bases)
+    return _POPCOUNT4[presence]
@@ -1,4 +1,4 @@
-from typing import List, Dict, Set, Tuple, Optional
+from typing import Collection, List, Dict, Set, Tuple, Optional
 import networkx as nx
 from collections import defaultdict, Counter
 
@@ -8,12 +8,12 @@ class ClassicSBH:
     def __init__(self):
         self._graph = None
     
-    def reconstruct(self, spectrum: List[str], target_length: int, k: int) -> str:
+    def reconstruct(self, spectrum: Collection[str], target_length: int, k: int) -> str:
         """
         Reconstruct DNA sequence from its spectrum using classic SBH algorithm
         
         Args:
-            spectrum: List of k-mers from hybridization
+            spectrum: K-mers from hybridization (list with repeats, or a set)
             target_length: Expected length of the DNA sequence
             k: Length of oligonucleotides in spectrum
             
@@ -244,7 +244,8 @@ class ClassicSBH:
         u, v, key = edge  # Get source, target nodes and edge key
         return self._graph[u][v][key]['kmer']
     
-    def _find_best_kmer_match(self, current_suffix: str, spectrum: List[str], used: Set[str], k: int) -> Tuple[str, float]:
+    def _find_best_kmer_match(self, current_suffix: str, spectrum: Collection[str], used: Set[str], k: int,
+                              kmer_counts: Counter) -> Tuple[str, float]:
         """Find the best matching k-mer from the spectrum"""
         best_match = None
         best_score = -1
@@ -264,13 +265,13 @@ class ClassicSBH:
                 continue
             if kmer.startswith(suffix):
                 # Calculate score based on frequency and overlap length
-                freq = spectrum.count(kmer)
+                freq = kmer_counts[kmer]
                 score = len(suffix) + 0.2 * freq
                 exact_matches.append((kmer, score))
                 
         if exact_matches:
             # Sort by score and frequency
-            exact_matches.sort(key=lambda x: (-x[1], -spectrum.count(x[0])))
+            exact_matches.sort(key=lambda x: (-x[1], -kmer_counts[x[0]]))
             return exact_matches[0]
             
         # If no exact matches, try partial overlaps with higher weight on longer overlaps
@@ -282,7 +283,7 @@ class ClassicSBH:
             for i in range(min(len(current_suffix), k-1), 2, -1):  # Require at least 3 bp overlap
                 if current_suffix[-i:] == kmer[:i]:
                     # Calculate score based on overlap length, frequency, and position
-                    freq = spectrum.count(kmer)
+                    freq = kmer_counts[kmer]
                     position_score = 1.0 if i == k-1 else 0.5  # Higher score for full k-1 overlap
                     score = i + 0.2 * freq + position_score
                     
@@ -293,7 +294,7 @@ class ClassicSBH:
                         
         return best_match, best_score
 
-    def _greedy_reconstruction(self, spectrum: List[str], target_length: int, k: int) -> str:
+    def _greedy_reconstruction(self, spectrum: Collection[str], target_length: int, k: int) -> str:
         """Greedy reconstruction when no Eulerian path exists"""
         print("\n=== Starting Greedy Reconstruction ===")
         
@@ -301,7 +302,10 @@ class ClassicSBH:
         start_time = time.time()
         max_runtime = 30  # Maximum 30 seconds for reconstruction
         
-        # Calculate k-mer frequencies and overlap scores
+        # Calculate k-mer frequencies once instead of rescanning the spectrum per lookup
+        kmer_counts = Counter(spectrum)
+        
+        # Calculate overlap scores
         kmer_scores = {}
         for kmer in spectrum:
             score = 0
@@ -310,8 +314,8 @@ class ClassicSBH:
                     # Check both prefix and suffix overlaps
                     for i in range(k-1, 2, -1):
                         if kmer.endswith(other[:i]) or kmer.startswith(other[-i:]):
-                            score += i * spectrum.count(other)  # Weight by frequency
-            kmer_scores[kmer] = score + 0.2 * spectrum.count(kmer)
+                            score += i * kmer_counts[other]  # Weight by frequency
+            kmer_scores[kmer] = score + 0.2 * kmer_counts[kmer]
             
         # Start with most promising k-mer
         current = max(spectrum, key=lambda x: kmer_scores[x])
@@ -355,7 +359,7 @@ class ClassicSBH:
                 print(f"Debug: Looking for k-mer with prefix {suffix}")
                 
                 # Find best matching k-mer
-                next_kmer, score = self._find_best_kmer_match(suffix, spectrum, used, k)
+                next_kmer, score = self._find_best_kmer_match(suffix, spectrum, used, k, kmer_counts)
                 
                 if next_kmer and score > min_overlap:
                     print(f"Debug: Found match {next_kmer} with score {score:.1f}")
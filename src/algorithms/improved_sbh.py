@@ -69,16 +69,12 @@ class ImprovedSBH:
         
         # 3. Try to correct questionable k-mers
         corrected_spectrum = list(reliable_kmers.keys())
+        corrections = self._find_single_mismatch_corrections(
+            list(questionable_kmers), list(reliable_kmers), k
+        )
         
         for q_kmer, q_count in questionable_kmers.items():
-            best_correction = None
-            min_distance = float('inf')
-            
-            for r_kmer in reliable_kmers:
-                distance = self._hamming_distance(q_kmer, r_kmer)
-                if distance == 1 and distance < min_distance:
-                    min_distance = distance
-                    best_correction = r_kmer
+            best_correction = corrections.get(q_kmer)
             
             if best_correction:
                 # Add corrected k-mer with adjusted count
@@ -91,11 +87,42 @@ class ImprovedSBH:
         
         return corrected_spectrum
     
-    def _hamming_distance(self, s1: str, s2: str) -> int:
-        """Calculate Hamming distance between two strings"""
-        if len(s1) != len(s2):
-            return float('inf')
-        return sum(c1 != c2 for c1, c2 in zip(s1, s2))
+    def _encode_kmers(self, kmers: List[str], k: int) -> np.ndarray:
+        """Encode k-mers as a (len(kmers), k) matrix of ASCII byte codes"""
+        return np.frombuffer(''.join(kmers).encode('ascii'), dtype=np.uint8).reshape(len(kmers), k)
+    
+    def _find_single_mismatch_corrections(self, questionable: List[str], reliable: List[str],
+                                          k: int) -> Dict[str, str]:
+        """Map each questionable k-mer to the first reliable k-mer at Hamming distance 1"""
+        if not questionable or not reliable:
+            return {}
+        
+        q_arr = self._encode_kmers(questionable, k)
+        r_arr = self._encode_kmers(reliable, k)
+        
+        # Compare in row blocks so the |Q| x |R| x k broadcast stays small
+        block = max(1, 4_000_000 // (len(reliable) * k))
+        corrections = {}
+        
+        for start in range(0, len(questionable), block):
+            distances = (q_arr[start:start + block, None, :] != r_arr[None, :, :]).sum(axis=2)
+            single_mismatch = distances == 1
+            has_match = single_mismatch.any(axis=1)
+            first_match = single_mismatch.argmax(axis=1)
+            
+            for offset in np.flatnonzero(has_match):
+                corrections[questionable[start + offset]] = reliable[first_match[offset]]
+        
+        return corrections
+    
+    def _group_sizes(self, rows: np.ndarray) -> np.ndarray:
+        """For every row of a byte matrix, count how many rows are identical to it"""
+        if rows.shape[1] == 0:
+            return np.full(rows.shape[0], rows.shape[0])
+        
+        keys = np.ascontiguousarray(rows).view(f'S{rows.shape[1]}').ravel()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        return counts[inverse]
     
     def _build_weighted_graph(self, spectrum: List[str], k: int) -> nx.DiGraph:
         """Build weighted de Bruijn graph with reliability scores"""
@@ -106,7 +133,13 @@ class ImprovedSBH:
         total_count = sum(kmer_counts.values())
         avg_count = total_count / len(kmer_counts)
         
-        for kmer, count in kmer_counts.items():
+        # Prefixes and suffixes are column views of the encoded k-mer matrix
+        kmers = list(kmer_counts)
+        encoded = self._encode_kmers(kmers, k)
+        prefix_neighbors = self._group_sizes(encoded[:, :-1])
+        suffix_neighbors = self._group_sizes(encoded[:, 1:])
+        
+        for i, (kmer, count) in enumerate(kmer_counts.items()):
             # Reliability based on frequency and neighborhood consistency
             reliability = min(1.0, count / avg_count)
             
@@ -114,10 +147,7 @@ class ImprovedSBH:
             prefix = kmer[:-1]
             suffix = kmer[1:]
             
-            prefix_neighbors = [k for k in kmer_counts if k[:-1] == prefix]
-            suffix_neighbors = [k for k in kmer_counts if k[1:] == suffix]
-            
-            neighborhood_score = (len(prefix_neighbors) + len(suffix_neighbors)) / 10.0
+            neighborhood_score = (prefix_neighbors[i] + suffix_neighbors[i]) / 10.0
             reliability *= min(1.0, neighborhood_score)
             
             self._kmer_reliability[kmer] = reliability
@@ -168,10 +198,11 @@ class ImprovedSBH:
         
         start_node = start_nodes[0]
         path = [start_node]
+        current_len = len(start_node)  # Tracks len(''.join(path)) without rebuilding it
         used_edges = set()
         
         current_node = start_node
-        while len(''.join(path)) < target_length:
+        while current_len < target_length:
             # Find best next edge
             best_edge = None
             best_weight = -1
@@ -195,9 +226,10 @@ class ImprovedSBH:
             next_node, edge_key = best_edge
             used_edges.add(edge_key)
             path.append(next_node)
+            current_len += len(next_node)
             current_node = next_node
         
-        return path if len(''.join(path)) >= target_length * 0.8 else None
+        return path if current_len >= target_length * 0.8 else None
     
     def _find_good_start_nodes(self, graph: nx.DiGraph, max_nodes: int) -> List[str]:
         """Find good starting nodes based on degree and edge weights"""
@@ -222,10 +254,11 @@ class ImprovedSBH:
     def _guided_random_walk(self, graph: nx.DiGraph, start_node: str, target_length: int, k: int) -> Optional[List[str]]:
         """Perform guided random walk favoring high-weight edges"""
         path = [start_node]
+        current_len = len(start_node)  # Tracks len(''.join(path)) without rebuilding it
         used_edges = set()
         current_node = start_node
         
-        while len(''.join(path)) < target_length:
+        while current_len < target_length:
             neighbors = list(graph.neighbors(current_node))
             if not neighbors:
                 break
@@ -251,9 +284,10 @@ class ImprovedSBH:
             next_node = np.random.choice(valid_neighbors, p=probabilities)
             used_edges.add((current_node, next_node))
             path.append(next_node)
+            current_len += len(next_node)
             current_node = next_node
         
-        return path if len(''.join(path)) >= target_length * 0.7 else None
+        return path if current_len >= target_length * 0.7 else None
     
     def _select_best_sequence(self, candidate_paths: List[List[str]], spectrum: List[str], 
                             target_length: int, k: int) -> str:
@@ -328,48 +362,50 @@ class ImprovedSBH:
             return 'A' * target_length
         
         # Start with most reliable k-mer
-        kmer_scores = {}
-        for kmer in set(spectrum):
-            reliability = self._kmer_reliability.get(kmer, 0.5)
-            kmer_scores[kmer] = reliability
+        kmers = list(set(spectrum))
+        reliability = np.fromiter((self._kmer_reliability.get(kmer, 0.5) for kmer in kmers),
+                                  dtype=np.float64, count=len(kmers))
         
-        current_kmer = max(kmer_scores.keys(), key=lambda x: kmer_scores[x])
+        current_kmer = kmers[reliability.argmax()]
         result = current_kmer
         used = {current_kmer}
         
         # Build sequence with look-ahead
         while len(result) < target_length:
             suffix = result[-(k-1):]
-            candidates = []
+            cand_kmers = []
+            cand_scores = []
             
             for kmer in spectrum:
                 if kmer not in used and kmer.startswith(suffix):
-                    score = self._kmer_reliability.get(kmer, 0.5)
-                    candidates.append((kmer, score))
+                    cand_kmers.append(kmer)
+                    cand_scores.append(self._kmer_reliability.get(kmer, 0.5))
             
-            if not candidates:
+            if not cand_kmers:
                 # Try with shorter suffix
                 for overlap_len in range(k-2, 0, -1):
                     suffix = result[-overlap_len:]
                     for kmer in spectrum:
                         if kmer not in used and kmer.startswith(suffix):
-                            score = self._kmer_reliability.get(kmer, 0.3)
-                            candidates.append((kmer, score))
-                    if candidates:
+                            cand_kmers.append(kmer)
+                            cand_scores.append(self._kmer_reliability.get(kmer, 0.3))
+                    if cand_kmers:
                         break
             
-            if not candidates:
+            if not cand_kmers:
                 # Random selection as last resort
                 unused = [kmer for kmer in spectrum if kmer not in used]
                 if unused:
-                    next_kmer = max(unused, key=lambda x: self._kmer_reliability.get(x, 0.1))
+                    unused_scores = np.fromiter((self._kmer_reliability.get(kmer, 0.1) for kmer in unused),
+                                                dtype=np.float64, count=len(unused))
+                    next_kmer = unused[unused_scores.argmax()]
                     result += next_kmer
                     used.add(next_kmer)
                 else:
                     break
             else:
                 # Select best candidate
-                next_kmer = max(candidates, key=lambda x: x[1])[0]
+                next_kmer = cand_kmers[np.asarray(cand_scores).argmax()]
                 overlap_len = len(suffix)
                 result += next_kmer[overlap_len:]
                 used.add(next_kmer)
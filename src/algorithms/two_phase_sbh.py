@@ -1,18 +1,52 @@
 from typing import List, Dict, Set, Tuple, Optional
-import networkx as nx
+import logging
 from collections import defaultdict, Counter
 import numpy as np
 from dataclasses import dataclass
-import time
+from ._kmer_codec import GAP_CODE, MAX_K, distinct_bases, encode, encode_array, prefix, suffix
+
+logger = logging.getLogger(__name__)
 
 @dataclass
-class Contig:
-    """Represents a contiguous sequence fragment"""
-    sequence: str
-    confidence: float
-    start_kmer: str
-    end_kmer: str
-    supporting_kmers: Set[str]
+class ContigArrays:
+    """Contiguous sequence fragments stored column-wise, one entry per contig"""
+    sequence_buffer: bytes  # All contig sequences concatenated
+    sequence_offsets: np.ndarray  # Contig i spans sequence_buffer[offsets[i]:offsets[i+1]]
+    confidence: np.ndarray
+    start_codes: np.ndarray  # 2-bit code of each contig's first k-mer
+    end_codes: np.ndarray  # 2-bit code of each contig's last k-mer
+    supporting_kmers: np.ndarray  # 2-bit codes of every contig's k-mers, concatenated
+    supporting_offsets: np.ndarray  # Contig i owns supporting_kmers[offsets[i]:offsets[i+1]]
+    
+    @classmethod
+    def from_records(cls, records: List[Tuple[str, float, List[int]]]) -> 'ContigArrays':
+        """Pack (sequence, confidence, supporting k-mer codes) records into columns"""
+        sequence_lengths = [len(sequence) for sequence, _, _ in records]
+        supporting_lengths = [len(codes) for _, _, codes in records]
+        supporting_kmers = np.fromiter((code for _, _, codes in records for code in codes),
+                                       dtype=np.uint64, count=sum(supporting_lengths))
+        supporting_offsets = np.concatenate(([0], np.cumsum(supporting_lengths, dtype=np.int64)))
+        
+        return cls(
+            sequence_buffer=''.join(sequence for sequence, _, _ in records).encode('ascii'),
+            sequence_offsets=np.concatenate(([0], np.cumsum(sequence_lengths, dtype=np.int64))),
+            confidence=np.array([confidence for _, confidence, _ in records], dtype=np.float64),
+            start_codes=supporting_kmers[supporting_offsets[:-1]] if records else np.empty(0, dtype=np.uint64),
+            end_codes=supporting_kmers[supporting_offsets[1:] - 1] if records else np.empty(0, dtype=np.uint64),
+            supporting_kmers=supporting_kmers,
+            supporting_offsets=supporting_offsets
+        )
+    
+    def __len__(self) -> int:
+        return len(self.confidence)
+    
+    def sequence(self, i: int) -> str:
+        """Sequence of contig i"""
+        return self.sequence_buffer[self.sequence_offsets[i]:self.sequence_offsets[i + 1]].decode('ascii')
+    
+    def kmer_codes(self, i: int) -> List[int]:
+        """2-bit codes of the k-mers supporting contig i"""
+        return self.supporting_kmers[self.supporting_offsets[i]:self.supporting_offsets[i + 1]].tolist()
 
 class ThreePhaseSBH:
     """Three-phase adaptive SBH algorithm with rescue mechanisms"""
@@ -34,45 +68,150 @@ class ThreePhaseSBH:
         Phase 2: Connect contigs and extend greedily  
         Phase 3: Rescue jumps to unvisited graph regions
         """
-        print(f"\n=== Three-Phase SBH Reconstruction ===")
-        print(f"Target: {target_length}, k: {k}, Spectrum: {len(spectrum)} k-mers")
-        print(f"Error threshold: {self.error_threshold}")
+        logger.debug("=== Three-Phase SBH Reconstruction ===")
+        logger.debug("Target: %d, k: %d, Spectrum: %d k-mers", target_length, k, len(spectrum))
+        logger.debug("Error threshold: %s", self.error_threshold)
         
         self._k = k
         self._target_length = target_length
-        self._used_kmers = set()
+        self._used_kmers = set()  # 2-bit codes of k-mers placed in the sequence
+        self._kmer_counts = Counter(spectrum)
+        distinct_kmers = list(self._kmer_counts)
+        kmer_codes = self._encode_kmers(distinct_kmers, k)
+        self._kmer_codes = dict(zip(distinct_kmers, kmer_codes))
+        self._complexity = self._kmer_complexity(distinct_kmers, kmer_codes, k)
+        (self._prefix_counts, self._suffix_counts,
+         self._prefix_buckets, self._suffix_buckets) = self._build_spectrum_indices(self._kmer_counts)
         
         # Analyze spectrum quality to determine strategy
         self._analyze_spectrum_quality(spectrum)
         
         # Phase 1: Build reliable contigs
-        print(f"\n--- Phase 1: Building Contigs ---")
+        logger.debug("--- Phase 1: Building Contigs ---")
         contigs = self._build_contigs(spectrum, k)
-        print(f"Built {len(contigs)} contigs")
+        logger.debug("Built %d contigs", len(contigs))
         
         if contigs:
             # Phase 2: Connect contigs
-            print(f"\n--- Phase 2: Connecting Contigs ---")
+            logger.debug("--- Phase 2: Connecting Contigs ---")
             sequence = self._connect_contigs(contigs, spectrum, k, target_length)
         else:
-            print("No contigs built, starting with greedy approach")
+            logger.debug("No contigs built, starting with greedy approach")
             sequence = ""
         
         # Phase 3: Rescue mechanism with graph jumping
-        print(f"\n--- Phase 3: Rescue Reconstruction ---")
+        logger.debug("--- Phase 3: Rescue Reconstruction ---")
         final_sequence = self._rescue_reconstruction(sequence, spectrum, k, target_length)
         
         return final_sequence
     
+    def _encode_kmers(self, kmers: List[str], k: int) -> List[int]:
+        """Encode distinct k-mers as 2-bit integer codes"""
+        if k <= MAX_K:
+            return encode_array(kmers, k).tolist()
+        return [encode(kmer) for kmer in kmers]
+    
+    def _kmer_complexity(self, kmers: List[str], codes: List[int], k: int) -> Dict[str, float]:
+        """Fraction of distinct bases in each k-mer, computed once per k-mer"""
+        if k <= MAX_K:
+            kmer_distinct = distinct_bases(np.array(codes, dtype=np.uint64), k).tolist()
+        else:
+            kmer_distinct = [len(set(kmer)) for kmer in kmers]
+        
+        complexity = {}
+        for kmer, code, n_kmer in zip(kmers, codes, kmer_distinct):
+            if code == GAP_CODE:
+                # Gapped k-mers have no base code, count their symbols directly
+                n_kmer = len(set(kmer))
+            complexity[kmer] = n_kmer / k
+        
+        return complexity
+    
+    def _build_spectrum_indices(self, kmer_counts: Counter) -> Tuple[Counter, Counter, Dict[str, List[str]], Dict[str, List[str]]]:
+        """Index the spectrum by (k-1)-prefix and (k-1)-suffix in a single pass
+        
+        Counts include duplicate k-mers, buckets hold each distinct k-mer once.
+        """
+        prefix_counts = Counter()
+        suffix_counts = Counter()
+        prefix_buckets = defaultdict(list)
+        suffix_buckets = defaultdict(list)
+        
+        for kmer, count in kmer_counts.items():
+            pre = kmer[:-1]
+            suf = kmer[1:]
+            prefix_counts[pre] += count
+            suffix_counts[suf] += count
+            prefix_buckets[pre].append(kmer)
+            suffix_buckets[suf].append(kmer)
+        
+        return prefix_counts, suffix_counts, prefix_buckets, suffix_buckets
+    
+    def _init_rescue_arrays(self, available_kmers: Set[str]):
+        """Lay out the distinct k-mers as parallel arrays so rescue scoring runs vectorized
+        
+        Index i refers to the i-th distinct k-mer in spectrum order. Prefixes are
+        numbered once, so available successor counts live in a flat array and
+        every k-mer knows the id of the prefix its suffix would match.
+        """
+        kmers = list(self._kmer_counts)
+        self._rescue_kmers = kmers
+        self._kmer_index = {kmer: i for i, kmer in enumerate(kmers)}
+        
+        self._prefix_ids = {}
+        prefix_ids = np.empty(len(kmers), dtype=np.int64)
+        for i, kmer in enumerate(kmers):
+            prefix_ids[i] = self._prefix_ids.setdefault(kmer[:-1], len(self._prefix_ids))
+        self._successor_ids = np.array([self._prefix_ids.get(kmer[1:], -1) for kmer in kmers], dtype=np.int64)
+        
+        self._available_mask = np.fromiter((kmer in available_kmers for kmer in kmers), dtype=bool, count=len(kmers))
+        multiplicity = np.fromiter(self._kmer_counts.values(), dtype=np.int64, count=len(kmers))
+        self._available_prefix_counts = np.bincount(
+            prefix_ids, weights=multiplicity * self._available_mask, minlength=len(self._prefix_ids)
+        ).astype(np.int64)
+        
+        self._good_kmer_mask = np.fromiter((self._complexity[kmer] >= 0.6 for kmer in kmers), dtype=bool, count=len(kmers))
+        self._lex_rank = np.empty(len(kmers), dtype=np.int64)
+        self._lex_rank[sorted(range(len(kmers)), key=kmers.__getitem__)] = np.arange(len(kmers))
+    
+    def _discard_available_kmer(self, available_kmers: Set[str], kmer: str):
+        """Drop a k-mer from the available pool and keep the rescue arrays in sync"""
+        if kmer in available_kmers:
+            available_kmers.discard(kmer)
+            self._available_mask[self._kmer_index[kmer]] = False
+            self._available_prefix_counts[self._prefix_ids[kmer[:-1]]] -= self._kmer_counts[kmer]
+    
+    def _count_available_successors(self, suf: str, available_kmers: Set[str], exclude: Optional[str] = None) -> int:
+        """Count available k-mers (with duplicates) that start with the given (k-1)-suffix"""
+        prefix_id = self._prefix_ids.get(suf)
+        if prefix_id is None:
+            return 0
+        
+        count = int(self._available_prefix_counts[prefix_id])
+        if exclude is not None and exclude[:-1] == suf and exclude in available_kmers:
+            count -= self._kmer_counts[exclude]
+        return count
+    
+    def _available_connectivity(self) -> np.ndarray:
+        """Available successor count of every k-mer, -1 for k-mers no longer available"""
+        connectivity = np.where(self._successor_ids >= 0, self._available_prefix_counts[self._successor_ids], 0)
+        return np.where(self._available_mask, connectivity, -1)
+    
+    def _ordered_kmers(self) -> List[str]:
+        """List available k-mers in spectrum order where a deterministic order matters"""
+        return [self._rescue_kmers[i] for i in np.flatnonzero(self._available_mask).tolist()]
+    
     def _analyze_spectrum_quality(self, spectrum: List[str]):
         """Analyze spectrum to determine adaptive strategy"""
-        unique_kmers = len(set(spectrum))
+        kmer_counts = self._kmer_counts
+        unique_kmers = len(kmer_counts)
         total_kmers = len(spectrum)
         coverage = total_kmers / unique_kmers if unique_kmers > 0 else 1
         
-        # Calculate k-mer frequency distribution
-        kmer_counts = Counter(spectrum)
-        freq_variance = np.var(list(kmer_counts.values()))
+        # Calculate k-mer frequency distribution (cached for the reliability filter)
+        self._count_array = np.fromiter(kmer_counts.values(), dtype=np.int64, count=unique_kmers)
+        self._max_count = int(self._count_array.max()) if unique_kmers else 0
+        freq_variance = self._count_array.var()
         
         # Determine strategy based on quality metrics
         if coverage < 1.2 and freq_variance < 2:
@@ -85,143 +224,137 @@ class ThreePhaseSBH:
             self._adaptive_strategy = "conservative"  # Medium quality
             self._phase1_confidence_threshold = 0.6
         
-        print(f"Spectrum quality analysis:")
-        print(f"  Coverage: {coverage:.2f}, Variance: {freq_variance:.2f}")
-        print(f"  Adaptive strategy: {self._adaptive_strategy}")
+        logger.debug("Spectrum quality analysis:")
+        logger.debug("  Coverage: %.2f, Variance: %.2f", coverage, freq_variance)
+        logger.debug("  Adaptive strategy: %s", self._adaptive_strategy)
     
-    def _build_contigs(self, spectrum: List[str], k: int) -> List[Contig]:
+    def _build_contigs(self, spectrum: List[str], k: int) -> ContigArrays:
         """Phase 1: Build reliable contigs from high-confidence k-mers"""
         # Analyze k-mer reliability
         reliable_kmers = self._identify_reliable_kmers(spectrum)
-        print(f"Identified {len(reliable_kmers)} reliable k-mers out of {len(spectrum)}")
+        logger.debug("Identified %d reliable k-mers out of %d", len(reliable_kmers), len(spectrum))
         
         # Build overlap graph for reliable k-mers only
-        overlap_graph = self._build_overlap_graph(reliable_kmers, k-1)
+        kmer_list = list(reliable_kmers)
+        successors, in_degree = self._build_overlap_graph(kmer_list, k-1)
         
         # Find simple paths (contigs) in the graph
-        contigs = self._extract_contigs(overlap_graph, reliable_kmers)
+        contigs = self._extract_contigs(successors, in_degree, kmer_list)
         
         return contigs
     
     def _identify_reliable_kmers(self, spectrum: List[str]) -> Set[str]:
         """Identify k-mers that are likely to be correct"""
-        kmer_counts = Counter(spectrum)
+        kmer_counts = self._kmer_counts
         reliable_kmers = set()
         
         # Adjust thresholds based on adaptive strategy
         if self._adaptive_strategy == "aggressive":
             min_freq = 1
-            max_freq = max(kmer_counts.values()) * 2
+            max_freq = self._max_count * 2
         elif self._adaptive_strategy == "rescue":
             min_freq = 2
-            max_freq = max(kmer_counts.values()) * 0.8
+            max_freq = self._max_count * 0.8
         else:  # conservative
             min_freq = 1
-            max_freq = max(kmer_counts.values()) * 1.5
+            max_freq = self._max_count * 1.5
         
-        for kmer, count in kmer_counts.items():
-            if min_freq <= count <= max_freq:
-                # Additional quality checks
-                if self._assess_kmer_quality(kmer, spectrum):
-                    reliable_kmers.add(kmer)
+        # Frequency and complexity filters over all distinct k-mers at once
+        counts = self._count_array
+        complexity = np.fromiter(self._complexity.values(), dtype=np.float64, count=len(self._complexity))
+        reliable_mask = (counts >= min_freq) & (counts <= max_freq)
+        reliable_mask &= complexity >= 0.5  # Drop too repetitive k-mers
+        # Every spectrum k-mer counts towards its own prefix and suffix, so the
+        # neighborhood check (at least one neighbor each way) always holds
         
-        return reliable_kmers
-    
-    def _assess_kmer_quality(self, kmer: str, spectrum: List[str]) -> bool:
-        """Assess if a k-mer is likely to be correct"""
-        # Check for low-complexity regions
-        if len(set(kmer)) < len(kmer) * 0.5:  # Too repetitive
-            return False
-        
-        # Check neighborhood consistency
-        prefix = kmer[:-1]
-        suffix = kmer[1:]
-        
-        prefix_neighbors = [s for s in spectrum if s.startswith(prefix)]
-        suffix_neighbors = [s for s in spectrum if s.endswith(suffix)]
+        kmers = list(kmer_counts)
+        reliable_kmers.update(kmers[i] for i in np.flatnonzero(reliable_mask).tolist())
         
-        # Should have reasonable number of neighbors
-        return len(prefix_neighbors) >= 1 and len(suffix_neighbors) >= 1
+        return reliable_kmers
     
-    def _build_overlap_graph(self, kmers: Set[str], overlap_len: int) -> nx.DiGraph:
-        """Build directed overlap graph"""
-        G = nx.DiGraph()
-        
-        for kmer in kmers:
-            G.add_node(kmer)
+    def _build_overlap_graph(self, kmers: List[str], overlap_len: int) -> Tuple[List[List[int]], np.ndarray]:
+        """Build directed overlap graph as successor lists and in-degrees indexed by position in kmers"""
+        successors = [[] for _ in kmers]
+        in_degree = np.zeros(len(kmers), dtype=np.int32)
         
-        for kmer1 in kmers:
-            suffix = kmer1[-overlap_len:]
-            for kmer2 in kmers:
-                if kmer1 != kmer2 and kmer2.startswith(suffix):
-                    # Add edge with weight based on reliability
-                    weight = self._calculate_edge_weight(kmer1, kmer2)
-                    G.add_edge(kmer1, kmer2, weight=weight)
+        for i, j in self._overlap_pairs(kmers, overlap_len + 1):
+            successors[i].append(j)
+            in_degree[j] += 1
         
-        return G
+        return successors, in_degree
     
-    def _calculate_edge_weight(self, kmer1: str, kmer2: str) -> float:
-        """Calculate edge weight based on connection reliability"""
-        # Simple weight based on k-mer quality
-        base_weight = 1.0
-        
-        # Penalize low-complexity connections
-        overlap = kmer1[1:]
-        if len(set(overlap)) < len(overlap) * 0.6:
-            base_weight *= 0.5
-        
-        return base_weight
+    def _overlap_pairs(self, kmers: List[str], k: int):
+        """Yield index pairs (i, j) where the (k-1)-suffix of kmers[i] is the (k-1)-prefix of kmers[j]"""
+        if k > MAX_K:
+            # Codes do not fit in uint64, bucket by prefix string instead
+            prefix_index: Dict[str, List[int]] = defaultdict(list)
+            for j, kmer in enumerate(kmers):
+                prefix_index[kmer[:-1]].append(j)
+            
+            for i, kmer in enumerate(kmers):
+                for j in prefix_index.get(kmer[1:], ()):
+                    if j != i:
+                        yield i, j
+            return
+        
+        codes = np.fromiter((self._kmer_codes[kmer] for kmer in kmers), dtype=np.uint64, count=len(kmers))
+        prefixes = prefix(codes, k)
+        suffixes = suffix(codes, k)
+        
+        # Sort by prefix once; each suffix's successors form one contiguous run
+        order = np.argsort(prefixes, kind='stable')
+        sorted_prefixes = prefixes[order]
+        starts = np.searchsorted(sorted_prefixes, suffixes, side='left')
+        ends = np.searchsorted(sorted_prefixes, suffixes, side='right')
+        
+        # Gapped k-mers share the sentinel code and never overlap anything
+        sources = (ends > starts) & (codes != GAP_CODE)
+        for i in np.flatnonzero(sources).tolist():
+            for j in order[starts[i]:ends[i]].tolist():
+                if j != i:
+                    yield i, j
     
-    def _extract_contigs(self, graph: nx.DiGraph, kmers: Set[str]) -> List[Contig]:
+    def _extract_contigs(self, successors: List[List[int]], in_degree: np.ndarray, kmers: List[str]) -> ContigArrays:
         """Extract contigs from overlap graph"""
-        contigs = []
-        visited = set()
+        records = []
+        visited = np.zeros(len(kmers), dtype=bool)
         
         # Find simple paths (no branching)
-        for start_node in graph.nodes():
-            if start_node in visited:
+        for start_node in range(len(kmers)):
+            if visited[start_node]:
                 continue
                 
-            if graph.in_degree(start_node) == 0 or graph.in_degree(start_node) > 1:
+            if in_degree[start_node] != 1:
                 # Potential start of contig
-                path = self._follow_simple_path(graph, start_node, visited)
+                path = [kmers[i] for i in self._follow_simple_path(successors, in_degree, start_node, visited)]
                 if len(path) >= 2:  # At least 2 k-mers
                     contig_seq = self._path_to_sequence(path)
                     confidence = self._calculate_contig_confidence(path)
                     
-                    contig = Contig(
-                        sequence=contig_seq,
-                        confidence=confidence,
-                        start_kmer=path[0],
-                        end_kmer=path[-1],
-                        supporting_kmers=set(path)
-                    )
-                    contigs.append(contig)
+                    records.append((contig_seq, confidence, [self._kmer_codes[kmer] for kmer in path]))
         
-        return contigs
+        return ContigArrays.from_records(records)
     
-    def _follow_simple_path(self, graph: nx.DiGraph, start: str, visited: set) -> List[str]:
+    def _follow_simple_path(self, successors: List[List[int]], in_degree: np.ndarray, start: int, visited: np.ndarray) -> List[int]:
         """Follow a simple path without branching"""
         path = [start]
-        visited.add(start)
+        visited[start] = True
         current = start
         
         while True:
-            successors = list(graph.successors(current))
             # Continue only if exactly one unvisited successor
-            unvisited_successors = [s for s in successors if s not in visited]
+            unvisited_successors = [s for s in successors[current] if not visited[s]]
+            if len(unvisited_successors) != 1:
+                break
             
-            if len(unvisited_successors) == 1:
-                next_node = unvisited_successors[0]
-                # Check if next node has only one predecessor (no convergence)
-                if graph.in_degree(next_node) == 1:
-                    path.append(next_node)
-                    visited.add(next_node)
-                    current = next_node
-                else:
-                    break
-            else:
+            next_node = unvisited_successors[0]
+            # Check if next node has only one predecessor (no convergence)
+            if in_degree[next_node] != 1:
                 break
+            
+            path.append(next_node)
+            visited[next_node] = True
+            current = next_node
         
         return path
     
@@ -230,11 +363,11 @@ class ThreePhaseSBH:
         if not path:
             return ""
         
-        sequence = path[0]
+        buf = bytearray(path[0], 'ascii')
         for kmer in path[1:]:
-            sequence += kmer[-1]  # Add last character
+            buf.append(ord(kmer[-1]))  # Add last character
         
-        return sequence
+        return buf.decode('ascii')
     
     def _calculate_contig_confidence(self, path: List[str]) -> float:
         """Calculate confidence score for a contig"""
@@ -247,96 +380,136 @@ class ThreePhaseSBH:
         
         return base_confidence
     
-    def _connect_contigs(self, contigs: List[Contig], spectrum: List[str], k: int, target_length: int) -> str:
+    def _connect_contigs(self, contigs: ContigArrays, spectrum: List[str], k: int, target_length: int) -> str:
         """Phase 2: Connect contigs and extend greedily"""
-        if not contigs:
+        if not len(contigs):
             return ""
         
-        # Start with highest confidence contig
-        contigs.sort(key=lambda c: c.confidence, reverse=True)
-        current_sequence = contigs[0].sequence
-        self._used_kmers.update(contigs[0].supporting_kmers)
-        
-        # Try to extend with other contigs
-        remaining_contigs = contigs[1:]
+        # Rank contigs by confidence (stable, so equal scores keep extraction order)
+        order = np.argsort(-contigs.confidence, kind='stable').tolist()
+        sequences = [contigs.sequence(i) for i in order]
         
-        while len(current_sequence) < target_length and remaining_contigs:
-            extended = False
-            
-            for i, contig in enumerate(remaining_contigs):
-                # Try to connect at the end
-                connection = self._find_connection(current_sequence, contig.sequence, k)
-                if connection:
-                    current_sequence += connection
-                    self._used_kmers.update(contig.supporting_kmers)
-                    remaining_contigs.pop(i)
-                    extended = True
-                    break
+        # Start with highest confidence contig
+        parts = [sequences[0]]
+        current_length = len(sequences[0])
+        # Only the last k-1 bases can take part in an overlap
+        current_tail = sequences[0][-(k-1):]
+        self._used_kmers.update(contigs.kmer_codes(order[0]))
+        
+        # Index contigs by every prefix that could overlap the tail; buckets list
+        # ranks in descending order so the best live candidate sits at the end
+        prefix_to_contigs = defaultdict(list)
+        for i in range(len(sequences) - 1, 0, -1):
+            sequence = sequences[i]
+            for overlap_len in range(1, min(k-1, len(sequence)) + 1):
+                prefix_to_contigs[sequence[:overlap_len]].append(i)
+        alive = np.ones(len(sequences), dtype=bool)
+        alive[0] = False
+        
+        while current_length < target_length:
+            # Pick the highest-confidence live contig that overlaps the current tail
+            best = None
+            for overlap_len in range(1, min(k-1, len(current_tail)) + 1):
+                bucket = prefix_to_contigs.get(current_tail[-overlap_len:])
+                while bucket and not alive[bucket[-1]]:
+                    bucket.pop()
+                if bucket and (best is None or bucket[-1] < best):
+                    best = bucket[-1]
             
-            if not extended:
+            if best is None:
                 break
-        
-        return current_sequence
+            
+            connection = self._find_connection(current_tail, sequences[best], k)
+            parts.append(connection)
+            current_length += len(connection)
+            current_tail = (current_tail + connection)[-(k-1):]
+            self._used_kmers.update(contigs.kmer_codes(order[best]))
+            alive[best] = False
+        
+        return ''.join(parts)
     
     def _find_connection(self, seq1: str, seq2: str, k: int) -> Optional[str]:
         """Find connection between two sequences"""
         # Look for overlap
-        for overlap_len in range(k-1, 0, -1):
-            if seq1.endswith(seq2[:overlap_len]):
-                return seq2[overlap_len:]
+        overlap_len = self._longest_suffix_prefix_overlap(seq1, seq2, k-1)
+        if overlap_len:
+            return seq2[overlap_len:]
         
         return None
     
+    def _longest_suffix_prefix_overlap(self, a: str, b: str, max_len: int) -> int:
+        """Length of the longest suffix of a (at most max_len) that is a prefix of b"""
+        if max_len <= 0 or not b:
+            return 0
+        
+        # An overlap can only start where b's first base occurs in a's tail,
+        # so test those positions (longest first) instead of every length
+        tail = a[-max_len:]
+        first = b[0]
+        pos = tail.find(first)
+        while pos != -1:
+            if b.startswith(tail[pos:]):
+                return len(tail) - pos
+            pos = tail.find(first, pos + 1)
+        
+        return 0
+    
     def _rescue_reconstruction(self, initial_sequence: str, spectrum: List[str], k: int, target_length: int) -> str:
         """Phase 3: Rescue reconstruction with graph jumping"""
         if not initial_sequence:
             # Start with best k-mer if no initial sequence
             initial_sequence = self._find_best_starting_kmer(spectrum, k)
         
-        current_sequence = initial_sequence
-        available_kmers = [s for s in spectrum if s not in self._used_kmers]
+        # Grow the sequence in a byte buffer and track only its (k-1)-suffix
+        sequence_buf = bytearray(initial_sequence, 'ascii')
+        current_suffix = initial_sequence[-(k-1):]
+        available_kmers = {s for s, code in self._kmer_codes.items() if code not in self._used_kmers}
+        self._init_rescue_arrays(available_kmers)
+        # The initial sequence's k-mers stay candidates until the first step succeeds
+        initial_kmers = self._get_sequence_kmers(initial_sequence, k)
         
-        print(f"Starting rescue with sequence length: {len(current_sequence)}")
-        print(f"Available k-mers: {len(available_kmers)}")
+        logger.debug("Starting rescue with sequence length: %d", len(sequence_buf))
+        logger.debug("Available k-mers: %d", len(available_kmers))
         
         max_iterations = target_length * 2  # Prevent infinite loops
         iteration = 0
+        suffix_len = k - 1  # Fixed for the whole rescue, hoisted out of the loop
         
-        while len(current_sequence) < target_length and available_kmers and iteration < max_iterations:
+        while len(sequence_buf) < target_length and available_kmers and iteration < max_iterations:
             iteration += 1
             
             # Phase 3a: Try standard extension
-            extended = self._try_standard_extension(current_sequence, available_kmers, k)
-            
-            if extended:
-                current_sequence = extended
-                # Remove used k-mers
-                available_kmers = [s for s in available_kmers if s not in self._get_sequence_kmers(current_sequence, k)]
-                continue
+            addition = self._try_standard_extension(current_suffix, len(sequence_buf), available_kmers, k)
             
             # Phase 3b: Try adaptive jump
-            jump_result = self._try_adaptive_jump(current_sequence, available_kmers, k, target_length)
-            
-            if jump_result:
-                current_sequence = jump_result
-                available_kmers = [s for s in available_kmers if s not in self._get_sequence_kmers(current_sequence, k)]
-                continue
+            if not addition:
+                addition = self._try_adaptive_jump(current_suffix, len(sequence_buf), available_kmers, k, target_length)
             
             # Phase 3c: Emergency connection
-            emergency_result = self._emergency_connection(current_sequence, available_kmers, k)
+            if not addition:
+                addition = self._emergency_connection(available_kmers, k)
             
-            if emergency_result:
-                current_sequence = emergency_result
-                available_kmers = [s for s in available_kmers if s not in self._get_sequence_kmers(current_sequence, k)]
-                continue
+            if not addition:
+                # If nothing works, break to avoid infinite loop
+                break
             
-            # If nothing works, break to avoid infinite loop
-            break
-        
-        print(f"Rescue completed after {iteration} iterations")
-        print(f"Final sequence length: {len(current_sequence)}/{target_length}")
-        
-        return current_sequence[:target_length] if len(current_sequence) > target_length else current_sequence
+            sequence_buf += addition.encode('ascii')
+            extended_tail = current_suffix + addition
+            current_suffix = extended_tail[-suffix_len:]
+            for kmer in initial_kmers:
+                self._discard_available_kmer(available_kmers, kmer)
+            initial_kmers = ()
+            # Remove the k-mers the addition completed (all of them end inside it,
+            # a single-base extension completes just one); gap windows never match
+            for end in range(k, len(extended_tail) + 1):
+                kmer = extended_tail[end - k:end]
+                if 'N' not in kmer:
+                    self._discard_available_kmer(available_kmers, kmer)
+        
+        logger.debug("Rescue completed after %d iterations", iteration)
+        logger.debug("Final sequence length: %d/%d", len(sequence_buf), target_length)
+        
+        return sequence_buf[:target_length].decode('ascii')
     
     def _find_best_starting_kmer(self, spectrum: List[str], k: int) -> str:
         """Find the best k-mer to start reconstruction"""
@@ -347,38 +520,34 @@ class ThreePhaseSBH:
             kmer_scores[kmer] = score
         
         best_kmer = max(kmer_scores.keys(), key=lambda x: kmer_scores[x])
-        self._used_kmers.add(best_kmer)
+        self._used_kmers.add(self._kmer_codes[best_kmer])
         
         return best_kmer
     
     def _calculate_starting_score(self, kmer: str, spectrum: List[str], k: int) -> float:
         """Calculate score for starting k-mer"""
         # Prefer k-mers with good connectivity
-        prefix = kmer[:-1]
-        suffix = kmer[1:]
+        pre = kmer[:-1]
+        suf = kmer[1:]
         
-        out_degree = len([s for s in spectrum if s.startswith(suffix)])
-        in_degree = len([s for s in spectrum if s.endswith(prefix)])
+        out_degree = self._prefix_counts[suf]
+        in_degree = self._suffix_counts[pre]
         
         # Prefer k-mers that are potential starts (low in-degree) or have good connectivity
         connectivity_score = out_degree - in_degree * 0.5
-        complexity_score = len(set(kmer)) / len(kmer)  # Prefer complex k-mers
+        complexity_score = self._complexity[kmer]  # Prefer complex k-mers
         
         return connectivity_score + complexity_score
     
-    def _try_standard_extension(self, sequence: str, available_kmers: List[str], k: int) -> Optional[str]:
-        """Try standard greedy extension with candidate_size limit"""
-        if len(sequence) < k:
+    def _try_standard_extension(self, current_suffix: str, sequence_length: int, available_kmers: Set[str], k: int) -> Optional[str]:
+        """Try standard greedy extension with candidate_size limit, returning the base to append"""
+        if sequence_length < k:
             return None
         
-        current_suffix = sequence[-(k-1):]
-        candidates = []
-        
-        # Find all matching k-mers
-        for kmer in available_kmers:
-            if kmer.startswith(current_suffix):
-                score = self._calculate_extension_score(kmer, available_kmers, k)
-                candidates.append((score, kmer))
+        # Score the available k-mers that share the (k-1)-prefix
+        candidates = [(self._calculate_extension_score(kmer, available_kmers, k), kmer)
+                      for kmer in self._prefix_buckets.get(current_suffix, ())
+                      if kmer in available_kmers]
         
         if not candidates:
             return None
@@ -390,119 +559,109 @@ class ThreePhaseSBH:
         # Choose the best one (first in sorted list)
         best_score, best_kmer = top_candidates[0]
         
-        if best_kmer:
-            return sequence + best_kmer[-1]
-        
-        return None
+        return best_kmer[-1]
     
-    def _calculate_extension_score(self, kmer: str, available_kmers: List[str], k: int) -> float:
+    def _calculate_extension_score(self, kmer: str, available_kmers: Set[str], k: int) -> float:
         """Calculate score for extending with a k-mer"""
         # Base score
         score = 1.0
         
         # Bonus for k-mers that can be further extended
-        suffix = kmer[1:]
-        next_options = len([s for s in available_kmers if s.startswith(suffix) and s != kmer])
+        suf = kmer[1:]
+        next_options = self._count_available_successors(suf, available_kmers, exclude=kmer)
         score += next_options * 0.1
         
         # Bonus for complexity
-        complexity = len(set(kmer)) / len(kmer)
+        complexity = self._complexity[kmer]
         score += complexity
         
         return score
     
-    def _try_adaptive_jump(self, sequence: str, available_kmers: List[str], k: int, target_length: int) -> Optional[str]:
-        """Try adaptive jumping to unvisited graph regions"""
+    def _try_adaptive_jump(self, current_suffix: str, sequence_length: int, available_kmers: Set[str], k: int, target_length: int) -> Optional[str]:
+        """Try adaptive jumping to unvisited graph regions, returning the gap and jump target to append"""
         if not available_kmers:
             return None
         
         # Find best jump target based on strategy
         if self._adaptive_strategy == "aggressive":
-            jump_target = self._find_aggressive_jump(sequence, available_kmers, k)
+            jump_target = self._find_aggressive_jump(current_suffix, available_kmers, k)
         elif self._adaptive_strategy == "rescue":
-            jump_target = self._find_rescue_jump(sequence, available_kmers, k)
+            jump_target = self._find_rescue_jump(current_suffix, available_kmers, k)
         else:  # conservative
-            jump_target = self._find_conservative_jump(sequence, available_kmers, k)
+            jump_target = self._find_conservative_jump(current_suffix, available_kmers, k)
         
         if jump_target:
             # Add gap filler and jump
-            gap_length = max(1, min(5, target_length - len(sequence) - len(jump_target)))
+            gap_length = max(1, min(5, target_length - sequence_length - len(jump_target)))
             gap = 'N' * gap_length  # Use N's to mark gaps
             
-            return sequence + gap + jump_target
+            return gap + jump_target
         
         return None
     
-    def _find_aggressive_jump(self, sequence: str, available_kmers: List[str], k: int) -> Optional[str]:
+    def _find_aggressive_jump(self, current_suffix: str, available_kmers: Set[str], k: int) -> Optional[str]:
         """Aggressive jumping strategy - prefer high-connectivity k-mers with candidate_size limit"""
-        candidates = []
-        
-        for kmer in available_kmers:
-            # Score based on connectivity potential
-            suffix = kmer[1:]
-            connectivity = len([s for s in available_kmers if s.startswith(suffix)])
-            candidates.append((connectivity, kmer))
-        
-        if not candidates:
+        # A non-positive candidate_size keeps no candidates, so there is nothing to jump to
+        if self.candidate_size <= 0 or not available_kmers:
             return None
         
-        # Sort by connectivity and take top candidates
-        candidates.sort(reverse=True)
-        top_candidates = candidates[:self.candidate_size]
-        
-        # Return the best one
-        return top_candidates[0][1] if top_candidates else None
+        # Score every k-mer at once; ties go to the lexicographically largest k-mer
+        connectivity = self._available_connectivity()
+        best = np.flatnonzero(connectivity == connectivity.max())
+        return self._rescue_kmers[best[self._lex_rank[best].argmax()]]
     
-    def _find_conservative_jump(self, sequence: str, available_kmers: List[str], k: int) -> Optional[str]:
+    def _find_conservative_jump(self, current_suffix: str, available_kmers: Set[str], k: int) -> Optional[str]:
         """Conservative jumping - look for partial overlaps"""
-        current_end = sequence[-(k-2):] if len(sequence) >= k-2 else sequence
+        current_end = current_suffix[-(k-2):] if len(current_suffix) >= k-2 else current_suffix
         
         best_kmer = None
         best_overlap = -1
         
-        for kmer in available_kmers:
+        max_overlap = min(len(current_end), k-1)
+        for kmer in self._ordered_kmers():
             # Look for partial overlaps
-            for i in range(min(len(current_end), k-1), 0, -1):
-                if current_end.endswith(kmer[:i]):
-                    if i > best_overlap:
-                        best_overlap = i
-                        best_kmer = kmer
-                    break
+            overlap = self._longest_suffix_prefix_overlap(current_end, kmer, max_overlap)
+            if overlap and overlap > best_overlap:
+                best_overlap = overlap
+                best_kmer = kmer
         
         return best_kmer
     
-    def _find_rescue_jump(self, sequence: str, available_kmers: List[str], k: int) -> Optional[str]:
+    def _find_rescue_jump(self, current_suffix: str, available_kmers: Set[str], k: int) -> Optional[str]:
         """Rescue jumping - just pick any reasonable k-mer"""
         if not available_kmers:
             return None
         
         # Filter out low-complexity k-mers
-        good_kmers = [kmer for kmer in available_kmers 
-                     if len(set(kmer)) >= len(kmer) * 0.6]
+        good_kmers = self._available_mask & self._good_kmer_mask
         
-        if good_kmers:
-            # Pick one with good extension potential
-            return max(good_kmers, key=lambda x: len([s for s in available_kmers if s.startswith(x[1:])]))
+        if good_kmers.any():
+            # Pick one with good extension potential (first in spectrum order on ties)
+            connectivity = np.where(good_kmers, self._available_connectivity(), -1)
+            return self._rescue_kmers[connectivity.argmax()]
         else:
-            return available_kmers[0]  # Last resort
+            return self._rescue_kmers[self._available_mask.argmax()]  # Last resort
     
-    def _emergency_connection(self, sequence: str, available_kmers: List[str], k: int) -> Optional[str]:
-        """Emergency connection when all else fails"""
+    def _emergency_connection(self, available_kmers: Set[str], k: int) -> Optional[str]:
+        """Emergency connection when all else fails, returning the gap and k-mer to append"""
         if not available_kmers:
             return None
         
         # Just pick the first available k-mer and connect with gap
-        emergency_kmer = available_kmers[0]
+        emergency_kmer = self._rescue_kmers[self._available_mask.argmax()]
         gap = 'N' * min(3, k-1)  # Small gap
         
-        return sequence + gap + emergency_kmer
+        return gap + emergency_kmer
     
     def _get_sequence_kmers(self, sequence: str, k: int) -> Set[str]:
-        """Get all k-mers in a sequence"""
+        """Get all k-mers in a sequence, skipping those that span an 'N' gap"""
         if len(sequence) < k:
             return set()
         
-        return {sequence[i:i+k] for i in range(len(sequence) - k + 1)}
+        kmers = set()
+        for segment in sequence.split('N'):
+            kmers.update(segment[i:i+k] for i in range(len(segment) - k + 1))
+        return kmers
 
 # Keep backward compatibility
 TwoPhaseSBH = ThreePhaseSBH 
\ No newline at end of file
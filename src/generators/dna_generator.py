@@ -1,18 +1,20 @@
-import random
-from typing import List
+from typing import List, Optional
+import numpy as np
 
 class DNAGenerator:
     """Generator for random DNA sequences"""
     
     def __init__(self):
         self.nucleotides = ['A', 'C', 'G', 'T']
+        self._lut = np.frombuffer(''.join(self.nucleotides).encode('ascii'), dtype=np.uint8)
     
-    def generate(self, length: int) -> str:
+    def generate(self, length: int, rng: Optional[np.random.Generator] = None) -> str:
         """
         Generate a random DNA sequence of specified length
         
         Args:
             length: The length of DNA sequence to generate
+            rng: Optional seeded generator; defaults to NumPy's global random state
             
         Returns:
             A string representing the DNA sequence
@@ -23,4 +25,31 @@ class DNAGenerator:
         if length < 1:
             raise ValueError("DNA length must be positive")
             
-        return ''.join(random.choice(self.nucleotides) for _ in range(length)) 
\ No newline at end of file
+        if rng is None:
+            indices = np.random.randint(0, len(self.nucleotides), length, dtype=np.uint8)
+        else:
+            indices = rng.integers(0, len(self.nucleotides), length, dtype=np.uint8)
+        return self._lut[indices].tobytes().decode('ascii')
+    
+    def generate_batch(self, count: int, length: int) -> List[str]:
+        """
+        Generate several random DNA sequences of equal length in one call
+        
+        Args:
+            count: Number of sequences to generate
+            length: The length of each sequence
+            
+        Returns:
+            List of DNA sequences
+            
+        Raises:
+            ValueError: If length is less than 1 or count is negative
+        """
+        if length < 1:
+            raise ValueError("DNA length must be positive")
+        if count < 0:
+            raise ValueError("Sequence count cannot be negative")
+        
+        indices = np.random.randint(0, len(self.nucleotides), (count, length), dtype=np.uint8)
+        flat = self._lut[indices].tobytes().decode('ascii')
+        return [flat[i:i + length] for i in range(0, count * length, length)]
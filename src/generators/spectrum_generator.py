@@ -1,6 +1,6 @@
-import random
 from typing import List, Set
 from collections import Counter
+import numpy as np
 from src.generators.dna_generator import DNAGenerator
 
 class SpectrumGenerator:
@@ -32,26 +32,24 @@ class SpectrumGenerator:
         if not (0 <= negative_error_rate <= 1 and 0 <= positive_error_rate <= 1):
             raise ValueError("Error rates must be between 0 and 1")
         
-        # Generate complete spectrum with duplicates preserved
-        spectrum = []
-        for i in range(len(dna) - k + 1):
-            kmer = dna[i:i+k]
-            spectrum.append(kmer)
+        # Generate complete spectrum with duplicates preserved as a (n, k) window view
+        dna_bytes = np.frombuffer(dna.encode('ascii'), dtype=np.uint8)
+        windows = np.lib.stride_tricks.sliding_window_view(dna_bytes, k)
         
         # Apply negative errors (remove k-mers)
         if negative_error_rate > 0:
-            num_to_remove = int(len(spectrum) * negative_error_rate)
-            for _ in range(num_to_remove):
-                if spectrum:  # Check if there are still k-mers to remove
-                    idx = random.randrange(len(spectrum))
-                    spectrum.pop(idx)
+            num_to_remove = int(len(windows) * negative_error_rate)
+            keep = np.ones(len(windows), dtype=bool)
+            keep[np.random.choice(len(windows), num_to_remove, replace=False)] = False
+            windows = windows[keep]
+        
+        flat = windows.tobytes().decode('ascii')
+        spectrum = [flat[i:i + k] for i in range(0, len(flat), k)]
         
         # Apply positive errors (add random k-mers)
         if positive_error_rate > 0:
             num_to_add = int(len(spectrum) * positive_error_rate)
-            for _ in range(num_to_add):
-                # Generate random k-mer
-                random_kmer = self.dna_generator.generate(k)
-                spectrum.append(random_kmer)
+            # Generate all random k-mers in one batch
+            spectrum.extend(self.dna_generator.generate_batch(num_to_add, k))
         
         return spectrum 
\ No newline at end of file
@@ -6,15 +6,16 @@ from utils.spectrum_generator import SpectrumGenerator
 from utils.sequence_validator import SequenceValidator
 from utils.logger import Logger
 from utils.visualization import BenchmarkVisualizer
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor
+import csv
 import json
 import os
-import pandas as pd
 from datetime import datetime
 
-def run_benchmark(k: int, n: int, num_tests: int, logger: Logger) -> List[Dict]:
-    """Run benchmark tests and return results."""
-    results = []
+def _run_one_case(k: int, n: int, case_index: int, num_tests: int) -> Tuple[Dict, List[str]]:
+    """Run a single test case in a worker process and return its result with the log messages."""
+    messages = [f"\nTest case {case_index+1}/{num_tests}", f"Parameters: k={k}, n={n}"]
     
     # Initialize components
     sequence_generator = SequenceGenerator()
@@ -22,44 +23,67 @@ def run_benchmark(k: int, n: int, num_tests: int, logger: Logger) -> List[Dict]:
     sequence_validator = SequenceValidator()
     sbh = ClassicSBH()
     
-    for i in range(num_tests):
-        logger.log(f"\nTest case {i+1}/{num_tests}")
-        logger.log(f"Parameters: k={k}, n={n}")
-        
-        # Generate random sequence
-        original_sequence = sequence_generator.generate_random_sequence(n + k - 1)
-        logger.log(f"Original sequence: {original_sequence}")
+    # Generate random sequence
+    original_sequence = sequence_generator.generate_random_sequence(n + k - 1)
+    messages.append(f"Original sequence: {original_sequence}")
 
-        # Generate spectrum
-        spectrum = spectrum_generator.generate_spectrum(original_sequence, k)
-        logger.log(f"Generated spectrum with {len(spectrum)} k-mers")
+    # Generate spectrum
+    spectrum = spectrum_generator.generate_spectrum(original_sequence, k)
+    messages.append(f"Generated spectrum with {len(spectrum)} k-mers")
 
-        # Measure runtime
-        start_time = time.time()
-        reconstructed_sequence = sbh.reconstruct(list(spectrum), len(original_sequence), k)
-        runtime = time.time() - start_time
-        
-        logger.log(f"Reconstructed sequence: {reconstructed_sequence}")
+    # Measure runtime
+    start_time = time.time()
+    reconstructed_sequence = sbh.reconstruct(spectrum, len(original_sequence), k)
+    runtime = time.time() - start_time
+    
+    messages.append(f"Reconstructed sequence: {reconstructed_sequence}")
 
-        # Validate reconstruction
-        is_valid, coverage = sequence_validator.validate_reconstruction(
-            reconstructed_sequence, spectrum, k
-        )
-        logger.log(f"Valid: {is_valid}")
-        logger.log(f"Spectrum coverage in reconstruction: {coverage:.2f}%")
-        
-        # Store results
-        results.append({
-            'k': k,
-            'n': n,
-            'sequence_length': len(original_sequence),
-            'coverage': coverage,
-            'runtime': runtime,
-            'is_valid': is_valid
-        })
+    # Validate reconstruction
+    is_valid, coverage = sequence_validator.validate_reconstruction(
+        reconstructed_sequence, spectrum, k
+    )
+    messages.append(f"Valid: {is_valid}")
+    messages.append(f"Spectrum coverage in reconstruction: {coverage:.2f}%")
     
+    result = {
+        'k': k,
+        'n': n,
+        'sequence_length': len(original_sequence),
+        'coverage': coverage,
+        'runtime': runtime,
+        'is_valid': is_valid
+    }
+    return result, messages
+
+def _submit_benchmark(executor: ProcessPoolExecutor, k: int, n: int, num_tests: int) -> List[Future]:
+    """Queue every test case for one k on the worker pool."""
+    return [executor.submit(_run_one_case, k, n, i, num_tests) for i in range(num_tests)]
+
+def _collect_benchmark(futures: List[Future], logger: Logger) -> List[Dict]:
+    """Log and gather test case results in submission order."""
+    results = []
+    for future in futures:
+        result, messages = future.result()
+        for message in messages:
+            logger.log(message)
+        results.append(result)
     return results
 
+def run_benchmark(k: int, n: int, num_tests: int, logger: Logger, workers: Optional[int] = None) -> List[Dict]:
+    """Run benchmark tests across worker processes and return results."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _collect_benchmark(_submit_benchmark(executor, k, n, num_tests), logger)
+
+def _save_results(results: List[Dict], results_dir: str, name: str) -> None:
+    """Write result rows as compact JSON and as CSV."""
+    with open(os.path.join(results_dir, f'{name}.json'), 'w') as f:
+        json.dump(results, f, separators=(',', ':'))
+    
+    with open(os.path.join(results_dir, f'{name}.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]) if results else [], lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(results)
+
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='DNA Sequence Reconstruction')
@@ -67,6 +91,7 @@ def main():
     parser.add_argument('--n', type=int, default=100, help='number of k-mers')
     parser.add_argument('--tests', type=int, default=5, help='number of test cases')
     parser.add_argument('--benchmark', action='store_true', help='run benchmark tests')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
     args = parser.parse_args()
     
     # Create results directory
@@ -82,18 +107,16 @@ def main():
         k_values = [8, 10, 12, 14, 16]
         all_results = []
         
-        for k in k_values:
-            logger.log(f"\n=== Running benchmark for k={k} ===")
-            results = run_benchmark(k, args.n, args.tests, logger)
-            all_results.extend(results)
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            # Queue all k values up front so every test case shares the worker pool
+            pending = {k: _submit_benchmark(executor, k, args.n, args.tests) for k in k_values}
+            for k in k_values:
+                logger.log(f"\n=== Running benchmark for k={k} ===")
+                results = _collect_benchmark(pending[k], logger)
+                all_results.extend(results)
         
         # Save raw results in both JSON and CSV formats
-        with open(os.path.join(results_dir, 'raw_results.json'), 'w') as f:
-            json.dump(all_results, f, indent=2)
-        
-        # Convert to DataFrame and save as CSV
-        df = pd.DataFrame(all_results)
-        df.to_csv(os.path.join(results_dir, 'raw_results.csv'), index=False)
+        _save_results(all_results, results_dir, 'raw_results')
         
         # Generate visualizations
         visualizer = BenchmarkVisualizer(os.path.join(results_dir, 'plots'))
@@ -102,15 +125,10 @@ def main():
         logger.log(f"\nBenchmark results saved to {results_dir}")
     else:
         # Run single test
-        results = run_benchmark(args.k, args.n, args.tests, logger)
+        results = run_benchmark(args.k, args.n, args.tests, logger, args.workers)
         
         # Save results in both JSON and CSV formats
-        with open(os.path.join(results_dir, 'results.json'), 'w') as f:
-            json.dump(results, f, indent=2)
-        
-        # Convert to DataFrame and save as CSV
-        df = pd.DataFrame(results)
-        df.to_csv(os.path.join(results_dir, 'results.csv'), index=False)
+        _save_results(results, results_dir, 'results')
         
         # Generate visualizations
         visualizer = BenchmarkVisualizer(os.path.join(results_dir, 'plots'))
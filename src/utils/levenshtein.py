@@ -0,0 +1,64 @@
+try:
+    # Optional C implementation (bit-parallel), same distance as _myers_distance
+    from rapidfuzz.distance import Levenshtein as _rapidfuzz_levenshtein
+except ImportError:
+    _rapidfuzz_levenshtein = None
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """Calculate Levenshtein distance between two strings"""
+    if _rapidfuzz_levenshtein is not None:
+        return _rapidfuzz_levenshtein.distance(s1, s2)
+    return _myers_distance(s1, s2)
+
+def _myers_distance(s1: str, s2: str) -> int:
+    """Levenshtein distance in pure Python, used when rapidfuzz is not installed"""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if len(s2) == 0:
+        return len(s1)
+
+    # Myers' bit-parallel algorithm: bit j of each vector describes DP column
+    # j+1 of the current row, so a whole row updates with a few integer ops.
+    # Python ints are arbitrary-width, so no blocking is needed past 64 bases.
+    m = len(s2)
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    peq = {}
+    for j, c2 in enumerate(s2):
+        peq[c2] = peq.get(c2, 0) | (1 << j)
+    
+    positive_vertical = mask
+    negative_vertical = 0
+    distance = m
+    for c1 in s1:
+        eq = peq.get(c1, 0)
+        xv = eq | negative_vertical
+        xh = (((eq & positive_vertical) + positive_vertical) ^ positive_vertical) | eq
+        positive_horizontal = negative_vertical | (~(xh | positive_vertical) & mask)
+        negative_horizontal = positive_vertical & xh
+        if positive_horizontal & last_bit:
+            distance += 1
+        elif negative_horizontal & last_bit:
+            distance -= 1
+        # Row 0 grows by one per column, hence the carried-in 1
+        positive_horizontal = ((positive_horizontal << 1) | 1) & mask
+        negative_horizontal = (negative_horizontal << 1) & mask
+        positive_vertical = negative_horizontal | (~(xv | positive_horizontal) & mask)
+        negative_vertical = positive_horizontal & xv
+    
+    return distance
+
+def levenshtein_similarity(s1: str, s2: str) -> float:
+    """Calculate Levenshtein similarity as percentage"""
+    if not s1 and not s2:
+        return 100.0
+    
+    distance = levenshtein_distance(s1, s2)
+    max_length = max(len(s1), len(s2))
+    
+    if max_length == 0:
+        return 100.0
+    
+    similarity = (1 - distance / max_length) * 100
+    return max(0.0, similarity)  # Ensure non-negative
@@ -1,9 +1,13 @@
-import random
+import numpy as np
 
 class SequenceGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.nucleotides = ['A', 'C', 'G', 'T']
+        self._lut = np.frombuffer(''.join(self.nucleotides).encode('ascii'), dtype=np.uint8)
+        # Private generator: a seed makes runs reproducible without touching global random state
+        self._rng = np.random.default_rng(seed)
     
     def generate_random_sequence(self, length):
         """Generate a random DNA sequence of given length."""
-        return ''.join(random.choice(self.nucleotides) for _ in range(length)) 
\ No newline at end of file
+        indices = self._rng.integers(0, len(self.nucleotides), size=length, dtype=np.uint8)
+        return self._lut[indices].tobytes().decode('ascii')
\ No newline at end of file
@@ -1,17 +1,62 @@
+import numpy as np
+from .spectrum_generator import SpectrumGenerator
+
 class SequenceValidator:
+    def __init__(self):
+        self.spectrum_generator = SpectrumGenerator()
+        # Packed codes of the last frozenset spectrum, reused while it is validated against
+        self._cached_spectrum = None
+        self._cached_k = None
+        self._cached_codes = None
+    
     def validate_reconstruction(self, reconstructed_sequence, original_spectrum, k):
         """Validate reconstructed sequence against original spectrum."""
-        # Generate spectrum from reconstructed sequence
-        reconstructed_spectrum = set()
-        for i in range(len(reconstructed_sequence) - k + 1):
-            reconstructed_spectrum.add(reconstructed_sequence[i:i+k])
+        # Compare 2-bit packed spectra when both sides are plain ACGT k-mers
+        packed_result = self._packed_overlap(reconstructed_sequence, original_spectrum, k)
+        
+        if packed_result is not None:
+            correct_k_mers, is_valid = packed_result
+        else:
+            correct_k_mers, is_valid = self._counted_overlap(reconstructed_sequence, original_spectrum, k)
         
         # Calculate coverage
-        correct_k_mers = len(reconstructed_spectrum.intersection(original_spectrum))
         total_k_mers = len(original_spectrum)
         coverage = (correct_k_mers / total_k_mers) * 100 if total_k_mers > 0 else 0
         
-        # Check if all k-mers from original spectrum are present
-        is_valid = reconstructed_spectrum.issuperset(original_spectrum)
+        return is_valid, coverage
+    
+    def _packed_overlap(self, reconstructed_sequence, original_spectrum, k):
+        """(shared k-mers, all original k-mers present) via packed codes, or None if not packable."""
+        # Frozenset spectra are immutable, so their codes can be reused across calls
+        cacheable = isinstance(original_spectrum, frozenset)
+        if not (cacheable and original_spectrum is self._cached_spectrum and k == self._cached_k):
+            self._cached_spectrum = original_spectrum if cacheable else None
+            self._cached_k = k
+            self._cached_codes = self.spectrum_generator.encode_spectrum(original_spectrum, k)
+        original_codes = self._cached_codes
+        if original_codes is None:
+            return None
+        
+        reconstructed_codes = self.spectrum_generator.generate_spectrum_codes(reconstructed_sequence, k)
+        if reconstructed_codes is None:
+            return None
+        
+        correct_k_mers = len(np.intersect1d(reconstructed_codes, original_codes, assume_unique=True))
+        return correct_k_mers, correct_k_mers == len(original_codes)
+    
+    def _counted_overlap(self, reconstructed_sequence, original_spectrum, k):
+        """(shared k-mers, all original k-mers present) counted in one pass over the reconstruction."""
+        if not isinstance(original_spectrum, (set, frozenset)):
+            original_spectrum = set(original_spectrum)
+        
+        # Only matched k-mers are remembered, and the scan stops once every original k-mer is found
+        matched = set()
+        total = len(original_spectrum)
+        for i in range(len(reconstructed_sequence) - k + 1):
+            kmer = reconstructed_sequence[i:i + k]
+            if kmer in original_spectrum:
+                matched.add(kmer)
+                if len(matched) == total:
+                    break
         
-        return is_valid, coverage 
\ No newline at end of file
+        return len(matched), len(matched) == total
\ No newline at end of file
@@ -1,7 +1,61 @@
+import numpy as np
+
+# 2-bit base codes; any other symbol maps to an invalid marker
+_BASE_CODES = np.full(256, 255, dtype=np.uint8)
+for _code, _base in enumerate(b'ACGT'):
+    _BASE_CODES[_base] = _code
+_MAX_PACKED_K = 32  # A uint64 holds 32 bases
+
 class SpectrumGenerator:
+    def __init__(self, k=None):
+        # 2-bit place values per k-mer length; pass k to prebuild them for a fixed-k benchmark
+        self._place_values = {}
+        if k is not None:
+            self._get_place_values(k)
+    
     def generate_spectrum(self, sequence, k):
-        """Generate k-mer spectrum from a sequence."""
-        spectrum = set()
-        for i in range(len(sequence) - k + 1):
-            spectrum.add(sequence[i:i+k])
-        return spectrum 
\ No newline at end of file
+        """Generate k-mer spectrum from a sequence as an immutable, hashable set."""
+        if k < 1 or len(sequence) < k:
+            return frozenset()
+        
+        # View every window as one fixed-width item, convert them all to str in C
+        # and hand the whole list to the frozenset constructor in one call
+        kmers = self._windows(sequence, k).view(f'S{k}').ravel().astype(f'U{k}')
+        return frozenset(kmers.tolist())
+    
+    def generate_spectrum_codes(self, sequence, k):
+        """Generate k-mer spectrum as sorted unique 2-bit codes, or None if it cannot be packed."""
+        if k < 1 or len(sequence) < k:
+            return np.empty(0, dtype=np.uint64)
+        return self._pack(self._windows(sequence, k))
+    
+    def encode_spectrum(self, spectrum, k):
+        """Pack k-mer strings into sorted unique 2-bit codes, or None if they cannot be packed."""
+        # Mixed lengths could still sum to len(spectrum) * k, so check every k-mer
+        if k < 1 or any(len(kmer) != k for kmer in spectrum):
+            return None
+        joined = ''.join(spectrum).encode('ascii', errors='replace')
+        return self._pack(np.frombuffer(joined, dtype=np.uint8).reshape(-1, k))
+    
+    def _windows(self, sequence, k):
+        """Contiguous (n, k) array of the sequence's k-mer windows."""
+        sequence_bytes = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+        return np.ascontiguousarray(np.lib.stride_tricks.sliding_window_view(sequence_bytes, k))
+    
+    def _pack(self, kmer_bytes):
+        """Pack an (n, k) byte array into 2-bit uint64 codes."""
+        codes = _BASE_CODES[kmer_bytes]
+        if kmer_bytes.shape[1] > _MAX_PACKED_K or (codes == 255).any():
+            return None
+        
+        # Each k-mer's code is the dot product of its base codes with the place values
+        packed = codes.astype(np.uint64) @ self._get_place_values(kmer_bytes.shape[1])
+        return np.unique(packed)
+    
+    def _get_place_values(self, k):
+        """Powers of 4 (most significant base first) for packing k-mers of length k."""
+        place_values = self._place_values.get(k)
+        if place_values is None:
+            place_values = np.left_shift(np.uint64(1), 2 * np.arange(k - 1, -1, -1, dtype=np.uint64))
+            self._place_values[k] = place_values
+        return place_values
\ No newline at end of file
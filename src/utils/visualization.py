@@ -1,8 +1,18 @@
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files, skip GUI backend probing
 import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from typing import List, Dict
+from collections import defaultdict
+from typing import List, Dict, Optional
+import csv
+import math
 import os
+import statistics
+
+METRICS = ['coverage', 'runtime']
+STATISTICS = ['mean', 'std', 'min', 'max']
+
+# The plot style is global matplotlib state, so it only needs applying once per process
+_STYLE_SET = False
 
 class BenchmarkVisualizer:
     def __init__(self, output_dir: str = "benchmark_results/plots"):
@@ -10,82 +20,128 @@ class BenchmarkVisualizer:
         os.makedirs(output_dir, exist_ok=True)
         
         # Set style
-        plt.style.use('seaborn-v0_8')  # Using a specific seaborn style version
-        sns.set_theme()  # Set seaborn theme
+        global _STYLE_SET
+        if not _STYLE_SET:
+            plt.style.use('seaborn-v0_8')  # Using a specific seaborn style version
+            _STYLE_SET = True
+    
+    def _group_by_k(self, results: List[Dict]) -> Dict[int, Dict[str, list]]:
+        """Collect sequence lengths and metrics per k-mer size in a single pass."""
+        by_k = defaultdict(lambda: {'sequence_length': [], 'coverage': [], 'runtime': []})
+        for result in results:
+            group = by_k[result['k']]
+            group['sequence_length'].append(result['sequence_length'])
+            group['coverage'].append(result['coverage'])
+            group['runtime'].append(result['runtime'])
+        return dict(sorted(by_k.items()))
+    
+    def _axes(self, ax: Optional[plt.Axes]) -> plt.Axes:
+        """Clear and return the shared axes, or create a figure for a standalone plot."""
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 6))
+        else:
+            ax.clear()
+        return ax
+    
+    def _save(self, ax: plt.Axes, filename: str, owns_figure: bool):
+        """Save the axes' figure, closing it unless it is shared."""
+        ax.figure.savefig(os.path.join(self.output_dir, filename))
+        if owns_figure:
+            plt.close(ax.figure)
     
-    def plot_accuracy_by_k(self, results: List[Dict]):
+    def _boxplot_by_k(self, ax: plt.Axes, by_k: Dict[int, Dict[str, list]], metric: str):
+        """Draw one box per k-mer size."""
+        ax.boxplot([group[metric] for group in by_k.values()])
+        ax.set_xticks(range(1, len(by_k) + 1))
+        ax.set_xticklabels([str(k) for k in by_k])
+    
+    def _scatter_by_k(self, ax: plt.Axes, by_k: Dict[int, Dict[str, list]], metric: str):
+        """Scatter a metric against sequence length, one color per k-mer size."""
+        colors = plt.get_cmap('viridis')([i / max(len(by_k) - 1, 1) for i in range(len(by_k))])
+        for color, (k, group) in zip(colors, by_k.items()):
+            ax.scatter(group['sequence_length'], group[metric], color=color, label=str(k))
+        ax.legend(title='k')
+    
+    def plot_accuracy_by_k(self, by_k: Dict[int, Dict[str, list]], ax: Optional[plt.Axes] = None):
         """Plot accuracy vs k-mer size."""
-        df = pd.DataFrame(results)
+        owns_figure = ax is None
+        ax = self._axes(ax)
         
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(x='k', y='coverage', data=df)
-        plt.title('Accuracy by K-mer Size')
-        plt.xlabel('K-mer Size')
-        plt.ylabel('Spectrum Coverage (%)')
-        plt.grid(True, alpha=0.3)
+        self._boxplot_by_k(ax, by_k, 'coverage')
+        ax.set_title('Accuracy by K-mer Size')
+        ax.set_xlabel('K-mer Size')
+        ax.set_ylabel('Spectrum Coverage (%)')
+        ax.grid(True, alpha=0.3)
         
         # Save plot
-        plt.savefig(os.path.join(self.output_dir, 'accuracy_by_k.png'))
-        plt.close()
+        self._save(ax, 'accuracy_by_k.png', owns_figure)
     
-    def plot_accuracy_by_length(self, results: List[Dict]):
+    def plot_accuracy_by_length(self, by_k: Dict[int, Dict[str, list]], ax: Optional[plt.Axes] = None):
         """Plot accuracy vs sequence length."""
-        df = pd.DataFrame(results)
+        owns_figure = ax is None
+        ax = self._axes(ax)
         
-        plt.figure(figsize=(10, 6))
-        sns.scatterplot(x='sequence_length', y='coverage', data=df, hue='k')
-        plt.title('Accuracy by Sequence Length')
-        plt.xlabel('Sequence Length')
-        plt.ylabel('Spectrum Coverage (%)')
-        plt.grid(True, alpha=0.3)
+        self._scatter_by_k(ax, by_k, 'coverage')
+        ax.set_title('Accuracy by Sequence Length')
+        ax.set_xlabel('Sequence Length')
+        ax.set_ylabel('Spectrum Coverage (%)')
+        ax.grid(True, alpha=0.3)
         
         # Save plot
-        plt.savefig(os.path.join(self.output_dir, 'accuracy_by_length.png'))
-        plt.close()
+        self._save(ax, 'accuracy_by_length.png', owns_figure)
     
-    def plot_runtime_by_k(self, results: List[Dict]):
+    def plot_runtime_by_k(self, by_k: Dict[int, Dict[str, list]], ax: Optional[plt.Axes] = None):
         """Plot runtime vs k-mer size."""
-        df = pd.DataFrame(results)
+        owns_figure = ax is None
+        ax = self._axes(ax)
         
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(x='k', y='runtime', data=df)
-        plt.title('Runtime by K-mer Size')
-        plt.xlabel('K-mer Size')
-        plt.ylabel('Runtime (seconds)')
-        plt.grid(True, alpha=0.3)
+        self._boxplot_by_k(ax, by_k, 'runtime')
+        ax.set_title('Runtime by K-mer Size')
+        ax.set_xlabel('K-mer Size')
+        ax.set_ylabel('Runtime (seconds)')
+        ax.grid(True, alpha=0.3)
         
         # Save plot
-        plt.savefig(os.path.join(self.output_dir, 'runtime_by_k.png'))
-        plt.close()
+        self._save(ax, 'runtime_by_k.png', owns_figure)
     
-    def plot_runtime_by_length(self, results: List[Dict]):
+    def plot_runtime_by_length(self, by_k: Dict[int, Dict[str, list]], ax: Optional[plt.Axes] = None):
         """Plot runtime vs sequence length."""
-        df = pd.DataFrame(results)
+        owns_figure = ax is None
+        ax = self._axes(ax)
         
-        plt.figure(figsize=(10, 6))
-        sns.scatterplot(x='sequence_length', y='runtime', data=df, hue='k')
-        plt.title('Runtime by Sequence Length')
-        plt.xlabel('Sequence Length')
-        plt.ylabel('Runtime (seconds)')
-        plt.grid(True, alpha=0.3)
+        self._scatter_by_k(ax, by_k, 'runtime')
+        ax.set_title('Runtime by Sequence Length')
+        ax.set_xlabel('Sequence Length')
+        ax.set_ylabel('Runtime (seconds)')
+        ax.grid(True, alpha=0.3)
         
         # Save plot
-        plt.savefig(os.path.join(self.output_dir, 'runtime_by_length.png'))
-        plt.close()
+        self._save(ax, 'runtime_by_length.png', owns_figure)
     
     def plot_all_metrics(self, results: List[Dict]):
         """Generate all plots."""
-        self.plot_accuracy_by_k(results)
-        self.plot_accuracy_by_length(results)
-        self.plot_runtime_by_k(results)
-        self.plot_runtime_by_length(results)
+        # Group the results and build the figure once, then reuse them for every plot
+        by_k = self._group_by_k(results)
+        fig, ax = plt.subplots(figsize=(10, 6))
+        try:
+            self.plot_accuracy_by_k(by_k, ax)
+            self.plot_accuracy_by_length(by_k, ax)
+            self.plot_runtime_by_k(by_k, ax)
+            self.plot_runtime_by_length(by_k, ax)
+        finally:
+            plt.close(fig)
         
-        # Create summary statistics
-        df = pd.DataFrame(results)
-        summary = df.groupby('k').agg({
-            'coverage': ['mean', 'std', 'min', 'max'],
-            'runtime': ['mean', 'std', 'min', 'max']
-        }).round(2)
-        
-        # Save summary to CSV
-        summary.to_csv(os.path.join(self.output_dir, 'summary_statistics.csv')) 
\ No newline at end of file
+        # Save summary to CSV (same layout as a pandas groupby/agg export)
+        with open(os.path.join(self.output_dir, 'summary_statistics.csv'), 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow([''] + [metric for metric in METRICS for _ in STATISTICS])
+            writer.writerow([''] + STATISTICS * len(METRICS))
+            writer.writerow(['k'] + [''] * (len(METRICS) * len(STATISTICS)))
+            for k, group in by_k.items():
+                writer.writerow([k] + [value for metric in METRICS for value in self._summarize(group[metric])])
+    
+    def _summarize(self, values: list) -> list:
+        """Mean, sample standard deviation, min and max rounded to 2 places ('' when undefined)."""
+        std = statistics.stdev(values) if len(values) > 1 else math.nan
+        summary = [statistics.mean(values), std, min(values), max(values)]
+        return ['' if math.isnan(value) else round(value, 2) for value in summary]
\ No newline at end of file
@@ -9,7 +9,10 @@ import sys
 import time
 import csv
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
@@ -17,43 +20,47 @@ sys.path.append(str(Path(__file__).parent / "src"))
 from src.generators.dna_generator import DNAGenerator
 from src.generators.spectrum_generator import SpectrumGenerator
 from src.algorithms.two_phase_sbh import ThreePhaseSBH
+from src.utils.levenshtein import levenshtein_similarity
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings"""
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    
-    return previous_row[-1]
-
-def levenshtein_similarity(s1: str, s2: str) -> float:
-    """Calculate Levenshtein similarity as percentage"""
-    if not s1 and not s2:
-        return 100.0
-    
-    distance = levenshtein_distance(s1, s2)
-    max_length = max(len(s1), len(s2))
-    
-    if max_length == 0:
-        return 100.0
-    
-    similarity = (1 - distance / max_length) * 100
-    return max(0.0, similarity)  # Ensure non-negative
+def _run_one_case(candidate_size: int, repetition: int, sequence_length: int, k_mer_size: int,
+                  pos_error: float, neg_error: float, seed: int) -> dict:
+    """Run one (candidate_size, repetition) case in a worker process"""
+    np.random.seed(seed)
+    
+    # Generate test data
+    original_sequence = DNAGenerator().generate(sequence_length)
+    spectrum = SpectrumGenerator().generate(
+        original_sequence, 
+        k_mer_size, 
+        neg_error, 
+        pos_error
+    )
+    
+    # Test algorithm with current candidate_size
+    algorithm = ThreePhaseSBH(
+        error_threshold=0.15, 
+        candidate_size=candidate_size
+    )
+    
+    start_time = time.time()
+    reconstructed = algorithm.reconstruct(spectrum, sequence_length, k_mer_size)
+    execution_time = time.time() - start_time
+    
+    # Calculate Levenshtein similarity
+    similarity = levenshtein_similarity(original_sequence, reconstructed)
+    
+    return {
+        'candidate_size': candidate_size,
+        'repetition': repetition + 1,
+        'original_length': len(original_sequence),
+        'reconstructed_length': len(reconstructed),
+        'spectrum_size': len(spectrum),
+        'levenshtein_similarity': similarity,
+        'execution_time': execution_time
+    }
 
-def run_candidate_size_test():
-    """Run systematic test of candidate_size parameter"""
+def run_candidate_size_test(workers: Optional[int] = None):
+    """Run systematic test of candidate_size parameter (workers=None uses every core)"""
     
     # Test parameters
     SEQUENCE_LENGTH = 300
@@ -77,60 +84,35 @@ def run_candidate_size_test():
     # Results storage
     results = []
     
-    # Initialize generators
-    dna_gen = DNAGenerator()
-    spectrum_gen = SpectrumGenerator()
+    # Run every (candidate_size, repetition) case across worker processes;
+    # seeds are drawn here so workers do not share one random state
+    cases = [(candidate_size, repetition) for candidate_size in CANDIDATE_SIZES for repetition in range(REPETITIONS)]
+    seeds = np.random.randint(0, 2**31 - 1, size=len(cases)).tolist()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_one_case, candidate_size, repetition, SEQUENCE_LENGTH, K_MER_SIZE, POSITIVE_ERROR_RATE, NEGATIVE_ERROR_RATE, seed)
+            for (candidate_size, repetition), seed in zip(cases, seeds)
+        ]
+        case_results = [future.result() for future in futures]
     
     for candidate_size in CANDIDATE_SIZES:
         print(f"\n--- Testing candidate_size = {candidate_size} ---")
         
         candidate_results = []
         
-        for repetition in range(REPETITIONS):
-            print(f"  Repetition {repetition + 1}/{REPETITIONS}")
-            
-            # Generate test data
-            original_sequence = dna_gen.generate(SEQUENCE_LENGTH)
-            spectrum = spectrum_gen.generate(
-                original_sequence, 
-                K_MER_SIZE, 
-                NEGATIVE_ERROR_RATE, 
-                POSITIVE_ERROR_RATE
-            )
-            
-            print(f"    Generated sequence length: {len(original_sequence)}")
-            print(f"    Spectrum size: {len(spectrum)} k-mers")
-            
-            # Test algorithm with current candidate_size
-            algorithm = ThreePhaseSBH(
-                error_threshold=0.15, 
-                candidate_size=candidate_size
-            )
-            
-            start_time = time.time()
-            reconstructed = algorithm.reconstruct(spectrum, SEQUENCE_LENGTH, K_MER_SIZE)
-            execution_time = time.time() - start_time
-            
-            # Calculate Levenshtein similarity
-            similarity = levenshtein_similarity(original_sequence, reconstructed)
-            
-            # Store results
-            result = {
-                'candidate_size': candidate_size,
-                'repetition': repetition + 1,
-                'original_length': len(original_sequence),
-                'reconstructed_length': len(reconstructed),
-                'spectrum_size': len(spectrum),
-                'levenshtein_similarity': similarity,
-                'execution_time': execution_time
-            }
+        for result in case_results:
+            if result['candidate_size'] != candidate_size:
+                continue
+            print(f"  Repetition {result['repetition']}/{REPETITIONS}")
+            print(f"    Generated sequence length: {result['original_length']}")
+            print(f"    Spectrum size: {result['spectrum_size']} k-mers")
             
             results.append(result)
-            candidate_results.append(similarity)
+            candidate_results.append(result['levenshtein_similarity'])
             
-            print(f"    Reconstructed length: {len(reconstructed)}")
-            print(f"    Levenshtein similarity: {similarity:.2f}%")
-            print(f"    Execution time: {execution_time:.3f}s")
+            print(f"    Reconstructed length: {result['reconstructed_length']}")
+            print(f"    Levenshtein similarity: {result['levenshtein_similarity']:.2f}%")
+            print(f"    Execution time: {result['execution_time']:.3f}s")
         
         # Calculate statistics for this candidate_size
         avg_similarity = sum(candidate_results) / len(candidate_results)
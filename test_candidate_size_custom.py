@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Customizable test script for candidate_size parameter with Levenshtein similarity
-Usage: python test_candidate_size_custom.py --length 300 --k 8 --pos_error 0.05 --neg_error 0.05 --candidates "5,10,15,20,25" --repetitions 3
+Usage: python test_candidate_size_custom.py --length 300 --k 8 --pos_error 0.05 --neg_error 0.05 --candidates "5,10,15,20,25" --repetitions 3 [--workers 4]
 """
 
 import sys
@@ -9,7 +9,10 @@ import time
 import csv
 import argparse
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
@@ -17,44 +20,51 @@ sys.path.append(str(Path(__file__).parent / "src"))
 from src.generators.dna_generator import DNAGenerator
 from src.generators.spectrum_generator import SpectrumGenerator
 from src.algorithms.two_phase_sbh import ThreePhaseSBH
+from src.utils.levenshtein import levenshtein_similarity
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings"""
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    
-    return previous_row[-1]
-
-def levenshtein_similarity(s1: str, s2: str) -> float:
-    """Calculate Levenshtein similarity as percentage"""
-    if not s1 and not s2:
-        return 100.0
-    
-    distance = levenshtein_distance(s1, s2)
-    max_length = max(len(s1), len(s2))
+def _run_one_case(candidate_size: int, repetition: int, sequence_length: int, k_mer_size: int,
+                  pos_error: float, neg_error: float, seed: int) -> dict:
+    """Run one (candidate_size, repetition) case in a worker process"""
+    np.random.seed(seed)
+    
+    # Generate test data
+    original_sequence = DNAGenerator().generate(sequence_length)
+    spectrum = SpectrumGenerator().generate(
+        original_sequence, 
+        k_mer_size, 
+        neg_error, 
+        pos_error
+    )
     
-    if max_length == 0:
-        return 100.0
+    # Test algorithm with current candidate_size
+    algorithm = ThreePhaseSBH(
+        error_threshold=0.15, 
+        candidate_size=candidate_size
+    )
     
-    similarity = (1 - distance / max_length) * 100
-    return max(0.0, similarity)
+    start_time = time.time()
+    reconstructed = algorithm.reconstruct(spectrum, sequence_length, k_mer_size)
+    execution_time = time.time() - start_time
+    
+    # Calculate Levenshtein similarity
+    similarity = levenshtein_similarity(original_sequence, reconstructed)
+    
+    return {
+        'candidate_size': candidate_size,
+        'repetition': repetition + 1,
+        'original_length': len(original_sequence),
+        'reconstructed_length': len(reconstructed),
+        'spectrum_size': len(spectrum),
+        'levenshtein_similarity': similarity,
+        'execution_time': execution_time
+    }
 
 def run_candidate_size_test(sequence_length: int, k_mer_size: int, pos_error: float, 
-                           neg_error: float, candidate_sizes: List[int], repetitions: int):
+                           neg_error: float, candidate_sizes: List[int], repetitions: int,
+                           workers: Optional[int] = None):
     """Run systematic test of candidate_size parameter with custom parameters"""
+    # Results are grouped by candidate_size value, so each size is run once, in the given order
+    candidate_sizes = list(dict.fromkeys(candidate_sizes))
     
     print("="*80)
     print("CUSTOMIZABLE CANDIDATE SIZE TEST WITH LEVENSHTEIN SIMILARITY")
@@ -70,60 +80,35 @@ def run_candidate_size_test(sequence_length: int, k_mer_size: int, pos_error: fl
     # Results storage
     results = []
     
-    # Initialize generators
-    dna_gen = DNAGenerator()
-    spectrum_gen = SpectrumGenerator()
+    # Run every (candidate_size, repetition) case across worker processes;
+    # seeds are drawn here so workers do not share one random state
+    cases = [(candidate_size, repetition) for candidate_size in candidate_sizes for repetition in range(repetitions)]
+    seeds = np.random.randint(0, 2**31 - 1, size=len(cases)).tolist()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_one_case, candidate_size, repetition, sequence_length, k_mer_size, pos_error, neg_error, seed)
+            for (candidate_size, repetition), seed in zip(cases, seeds)
+        ]
+        case_results = [future.result() for future in futures]
     
     for candidate_size in candidate_sizes:
         print(f"\n--- Testing candidate_size = {candidate_size} ---")
         
         candidate_results = []
         
-        for repetition in range(repetitions):
-            print(f"  Repetition {repetition + 1}/{repetitions}")
-            
-            # Generate test data
-            original_sequence = dna_gen.generate(sequence_length)
-            spectrum = spectrum_gen.generate(
-                original_sequence, 
-                k_mer_size, 
-                neg_error, 
-                pos_error
-            )
-            
-            print(f"    Generated sequence length: {len(original_sequence)}")
-            print(f"    Spectrum size: {len(spectrum)} k-mers")
-            
-            # Test algorithm with current candidate_size
-            algorithm = ThreePhaseSBH(
-                error_threshold=0.15, 
-                candidate_size=candidate_size
-            )
-            
-            start_time = time.time()
-            reconstructed = algorithm.reconstruct(spectrum, sequence_length, k_mer_size)
-            execution_time = time.time() - start_time
-            
-            # Calculate Levenshtein similarity
-            similarity = levenshtein_similarity(original_sequence, reconstructed)
-            
-            # Store results
-            result = {
-                'candidate_size': candidate_size,
-                'repetition': repetition + 1,
-                'original_length': len(original_sequence),
-                'reconstructed_length': len(reconstructed),
-                'spectrum_size': len(spectrum),
-                'levenshtein_similarity': similarity,
-                'execution_time': execution_time
-            }
+        for result in case_results:
+            if result['candidate_size'] != candidate_size:
+                continue
+            print(f"  Repetition {result['repetition']}/{repetitions}")
+            print(f"    Generated sequence length: {result['original_length']}")
+            print(f"    Spectrum size: {result['spectrum_size']} k-mers")
             
             results.append(result)
-            candidate_results.append(similarity)
+            candidate_results.append(result['levenshtein_similarity'])
             
-            print(f"    Reconstructed length: {len(reconstructed)}")
-            print(f"    Levenshtein similarity: {similarity:.2f}%")
-            print(f"    Execution time: {execution_time:.3f}s")
+            print(f"    Reconstructed length: {result['reconstructed_length']}")
+            print(f"    Levenshtein similarity: {result['levenshtein_similarity']:.2f}%")
+            print(f"    Execution time: {result['execution_time']:.3f}s")
         
         # Calculate statistics for this candidate_size
         avg_similarity = sum(candidate_results) / len(candidate_results)
@@ -191,6 +176,7 @@ def main():
     parser.add_argument('--neg_error', type=float, default=0.05, help='Negative error rate (0.0-1.0)')
     parser.add_argument('--candidates', type=str, default="5,10,15,20,25", help='Candidate sizes (comma-separated)')
     parser.add_argument('--repetitions', type=int, default=3, help='Number of repetitions per candidate size')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
     
     args = parser.parse_args()
     
@@ -221,7 +207,7 @@ def main():
     # Run the test
     run_candidate_size_test(
         args.length, args.k, args.pos_error, args.neg_error, 
-        candidate_sizes, args.repetitions
+        candidate_sizes, args.repetitions, args.workers
     )
 
 if __name__ == "__main__":
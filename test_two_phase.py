@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
 Test script for Three-Phase SBH algorithm with adaptive strategy
-Usage: python test_two_phase.py --length 300 --k 8 --error 0.05 --error_threshold 0.15 --trials 3
+Usage: python test_two_phase.py --length 300 --k 8 --error 0.05 --error_threshold 0.15 --trials 3 [--workers 4]
 """
 
 import argparse
+import contextlib
+import io
+import os
 import time
 import sys
 from pathlib import Path
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
@@ -17,6 +24,8 @@ from src.generators.spectrum_generator import SpectrumGenerator
 from src.algorithms.classic_sbh import ClassicSBH
 from src.algorithms.two_phase_sbh import ThreePhaseSBH
 
+_BANNER = '=' * 60
+
 def calculate_accuracy(original: str, reconstructed: str) -> float:
     """Calculate reconstruction accuracy as percentage of correct characters"""
     if not original or not reconstructed:
@@ -27,123 +36,162 @@ def calculate_accuracy(original: str, reconstructed: str) -> float:
     if min_len == 0:
         return 0.0
     
-    # Count matching characters
-    matches = sum(1 for i in range(min_len) if original[i] == reconstructed[i])
+    # Count matching characters with one vectorized byte comparison
+    original_bytes = np.frombuffer(original.encode('ascii'), dtype=np.uint8)
+    reconstructed_bytes = np.frombuffer(reconstructed.encode('ascii'), dtype=np.uint8)
+    matches = int(np.count_nonzero(original_bytes[:min_len] == reconstructed_bytes[:min_len]))
     
     # Calculate accuracy based on original length
     accuracy = matches / len(original)
     return accuracy * 100
 
-def run_comparison_test(length: int, k: int, error_rate: float, error_threshold: float, trials: int):
+def _run_one_trial(length: int, k: int, error_rate: float, error_threshold: float, seed: int) -> dict:
+    """Run one comparison trial in a worker process"""
+    # Both generators draw from NumPy's global state, seeded per trial
+    np.random.seed(seed)
+    
+    # Generate test data
+    original_sequence = DNAGenerator().generate(length)
+    # Generate spectrum with errors directly
+    spectrum = SpectrumGenerator().generate(original_sequence, k, error_rate, error_rate)
+    
+    # Test Classic SBH; its step-by-step debug prints go to a per-trial buffer so
+    # parallel trials do not interleave them into the parent's report
+    start_time = time.perf_counter_ns()
+    with contextlib.redirect_stdout(io.StringIO()):
+        classic_result = ClassicSBH().reconstruct(spectrum, length, k)
+    classic_time = time.perf_counter_ns() - start_time
+    
+    # Test Three-Phase SBH
+    start_time = time.perf_counter_ns()
+    three_phase_result = ThreePhaseSBH(error_threshold=error_threshold).reconstruct(spectrum, length, k)
+    three_phase_time = time.perf_counter_ns() - start_time
+    
+    return {
+        'original_length': len(original_sequence),
+        'spectrum_size': len(spectrum),
+        'classic_length': len(classic_result),
+        'classic_accuracy': calculate_accuracy(original_sequence, classic_result),
+        'classic_time': classic_time,
+        'three_phase_length': len(three_phase_result),
+        'three_phase_accuracy': calculate_accuracy(original_sequence, three_phase_result),
+        'three_phase_time': three_phase_time
+    }
+
+def run_comparison_test(length: int, k: int, error_rate: float, error_threshold: float, trials: int,
+                        workers: Optional[int] = None):
     """Run comparison test between Classic and Three-Phase SBH"""
     
-    print(f"\n{'='*60}")
-    print(f"TEST PARAMETERS:")
-    print(f"Sequence length: {length}")
-    print(f"K-mer size: {k}")
-    print(f"Error rate: {error_rate:.1%}")
-    print(f"Error threshold: {error_threshold}")
-    print(f"Number of trials: {trials}")
-    print(f"{'='*60}")
-    
-    # Initialize algorithms
-    classic_sbh = ClassicSBH()
-    three_phase_sbh = ThreePhaseSBH(error_threshold=error_threshold)
+    # Each report block is collected into lines and written with a single call
+    sys.stdout.write("\n".join([
+        f"\n{_BANNER}",
+        f"TEST PARAMETERS:",
+        f"Sequence length: {length}",
+        f"K-mer size: {k}",
+        f"Error rate: {error_rate:.1%}",
+        f"Error threshold: {error_threshold}",
+        f"Number of trials: {trials}",
+        _BANNER
+    ]) + "\n")
     
     # Results storage
     classic_results = []
     three_phase_results = []
+    # Timings are integer nanoseconds from perf_counter_ns, converted to seconds only for printing
     classic_times = []
     three_phase_times = []
     
-    for trial in range(trials):
-        print(f"\n--- Trial {trial + 1}/{trials} ---")
-        
-        # Generate test data
-        dna_gen = DNAGenerator()
-        original_sequence = dna_gen.generate(length)
-        
-        spectrum_gen = SpectrumGenerator()
-        # Generate spectrum with errors directly
-        spectrum = spectrum_gen.generate(original_sequence, k, error_rate, error_rate)
-        
-        print(f"Generated sequence of length {len(original_sequence)}")
-        print(f"Spectrum size: {len(spectrum)} k-mers")
-        
-        # Test Classic SBH
-        print(f"\nTesting Classic SBH...")
-        start_time = time.time()
-        classic_result = classic_sbh.reconstruct(spectrum, length, k)
-        classic_time = time.time() - start_time
-        classic_accuracy = calculate_accuracy(original_sequence, classic_result)
-        
-        classic_results.append(classic_accuracy)
-        classic_times.append(classic_time)
-        
-        print(f"Classic SBH - Length: {len(classic_result)}, Accuracy: {classic_accuracy:.1f}%, Time: {classic_time:.3f}s")
+    # Trials are independent, so run them across worker processes;
+    # seeds are drawn here so workers do not share one random state
+    seeds = np.random.randint(0, 2**31 - 1, size=trials).tolist()
+    
+    # No more workers than trials; map yields results in trial order as they finish,
+    # so each report is printed without waiting for the whole pool
+    max_workers = min(trials, workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        trial_results = executor.map(
+            _run_one_trial, [length] * trials, [k] * trials, [error_rate] * trials, [error_threshold] * trials, seeds
+        )
         
-        # Test Three-Phase SBH
-        print(f"\nTesting Three-Phase SBH...")
-        start_time = time.time()
-        three_phase_result = three_phase_sbh.reconstruct(spectrum, length, k)
-        three_phase_time = time.time() - start_time
-        three_phase_accuracy = calculate_accuracy(original_sequence, three_phase_result)
-        
-        three_phase_results.append(three_phase_accuracy)
-        three_phase_times.append(three_phase_time)
-        
-        print(f"Three-Phase SBH - Length: {len(three_phase_result)}, Accuracy: {three_phase_accuracy:.1f}%, Time: {three_phase_time:.3f}s")
-        
-        # Show improvement
-        accuracy_improvement = three_phase_accuracy - classic_accuracy
-        time_ratio = classic_time / three_phase_time if three_phase_time > 0 else float('inf')
-        
-        print(f"\nTrial {trial + 1} Results:")
-        print(f"  Accuracy improvement: {accuracy_improvement:+.1f}%")
-        print(f"  Speed ratio: {time_ratio:.1f}x {'faster' if time_ratio > 1 else 'slower'}")
+        for trial, result in enumerate(trial_results):
+            lines = [
+                f"\n--- Trial {trial + 1}/{trials} ---",
+                f"Generated sequence of length {result['original_length']}",
+                f"Spectrum size: {result['spectrum_size']} k-mers"
+            ]
+            
+            classic_accuracy = result['classic_accuracy']
+            classic_time = result['classic_time']
+            classic_results.append(classic_accuracy)
+            classic_times.append(classic_time)
+            
+            lines.append(f"\nTesting Classic SBH...")
+            lines.append(f"Classic SBH - Length: {result['classic_length']}, Accuracy: {classic_accuracy:.1f}%, Time: {classic_time / 1e9:.3f}s")
+            
+            three_phase_accuracy = result['three_phase_accuracy']
+            three_phase_time = result['three_phase_time']
+            three_phase_results.append(three_phase_accuracy)
+            three_phase_times.append(three_phase_time)
+            
+            lines.append(f"\nTesting Three-Phase SBH...")
+            lines.append(f"Three-Phase SBH - Length: {result['three_phase_length']}, Accuracy: {three_phase_accuracy:.1f}%, Time: {three_phase_time / 1e9:.3f}s")
+            
+            # Show improvement
+            accuracy_improvement = three_phase_accuracy - classic_accuracy
+            time_ratio = classic_time / max(three_phase_time, 1)
+            
+            lines.append(f"\nTrial {trial + 1} Results:")
+            lines.append(f"  Accuracy improvement: {accuracy_improvement:+.1f}%")
+            lines.append(f"  Speed ratio: {time_ratio:.1f}x {'faster' if time_ratio > 1 else 'slower'}")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
     
     # Overall results
-    print(f"\n{'='*60}")
-    print(f"OVERALL RESULTS ({trials} trials)")
-    print(f"{'='*60}")
-    
-    classic_avg_acc = sum(classic_results) / len(classic_results)
-    three_phase_avg_acc = sum(three_phase_results) / len(three_phase_results)
-    classic_avg_time = sum(classic_times) / len(classic_times)
-    three_phase_avg_time = sum(three_phase_times) / len(three_phase_times)
+    classic_acc = np.asarray(classic_results, dtype=np.float64)
+    three_phase_acc = np.asarray(three_phase_results, dtype=np.float64)
+    classic_time_arr = np.asarray(classic_times, dtype=np.float64)
+    three_phase_time_arr = np.asarray(three_phase_times, dtype=np.float64)
     
-    print(f"\nClassic SBH:")
-    print(f"  Average accuracy: {classic_avg_acc:.1f}%")
-    print(f"  Average time: {classic_avg_time:.3f}s")
+    classic_avg_acc = classic_acc.mean()
+    three_phase_avg_acc = three_phase_acc.mean()
+    classic_avg_time = classic_time_arr.mean()
+    three_phase_avg_time = three_phase_time_arr.mean()
     
-    print(f"\nThree-Phase SBH:")
-    print(f"  Average accuracy: {three_phase_avg_acc:.1f}%")
-    print(f"  Average time: {three_phase_avg_time:.3f}s")
-    
-    print(f"\nImprovements:")
     accuracy_improvement = three_phase_avg_acc - classic_avg_acc
-    time_ratio = classic_avg_time / three_phase_avg_time if three_phase_avg_time > 0 else float('inf')
-    
-    print(f"  Accuracy: {accuracy_improvement:+.1f}% improvement")
-    print(f"  Speed: {time_ratio:.1f}x {'faster' if time_ratio > 1 else 'slower'}")
+    time_ratio = classic_avg_time / max(three_phase_avg_time, 1)
     
     # Success rate (>50% accuracy)
-    classic_success_rate = len([x for x in classic_results if x > 50]) / len(classic_results) * 100
-    three_phase_success_rate = len([x for x in three_phase_results if x > 50]) / len(three_phase_results) * 100
-    
-    print(f"\nSuccess rate (>50% accuracy):")
-    print(f"  Classic SBH: {classic_success_rate:.0f}%")
-    print(f"  Three-Phase SBH: {three_phase_success_rate:.0f}%")
+    classic_success_rate = float((classic_acc > 50).mean()) * 100
+    three_phase_success_rate = float((three_phase_acc > 50).mean()) * 100
+    
+    sys.stdout.write("\n".join([
+        f"\n{_BANNER}",
+        f"OVERALL RESULTS ({trials} trials)",
+        _BANNER,
+        f"\nClassic SBH:",
+        f"  Average accuracy: {classic_avg_acc:.1f}% ± {classic_acc.std():.1f}%",
+        f"  Average time: {classic_avg_time / 1e9:.3f}s ± {classic_time_arr.std() / 1e9:.3f}s",
+        f"\nThree-Phase SBH:",
+        f"  Average accuracy: {three_phase_avg_acc:.1f}% ± {three_phase_acc.std():.1f}%",
+        f"  Average time: {three_phase_avg_time / 1e9:.3f}s ± {three_phase_time_arr.std() / 1e9:.3f}s",
+        f"\nImprovements:",
+        f"  Accuracy: {accuracy_improvement:+.1f}% improvement",
+        f"  Speed: {time_ratio:.1f}x {'faster' if time_ratio > 1 else 'slower'}",
+        f"\nSuccess rate (>50% accuracy):",
+        f"  Classic SBH: {classic_success_rate:.0f}%",
+        f"  Three-Phase SBH: {three_phase_success_rate:.0f}%"
+    ]) + "\n")
+
+_PARSER = argparse.ArgumentParser(description='Test Three-Phase SBH Algorithm')
+_PARSER.add_argument('--length', type=int, default=200, help='DNA sequence length')
+_PARSER.add_argument('--k', type=int, default=8, help='K-mer size')  
+_PARSER.add_argument('--error', type=float, default=0.05, help='Error rate (0.0-1.0)')
+_PARSER.add_argument('--error_threshold', type=float, default=0.15, help='Error threshold for adaptive strategy')
+_PARSER.add_argument('--trials', type=int, default=1, help='Number of test trials')
+_PARSER.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
 
 def main():
-    parser = argparse.ArgumentParser(description='Test Three-Phase SBH Algorithm')
-    parser.add_argument('--length', type=int, default=200, help='DNA sequence length')
-    parser.add_argument('--k', type=int, default=8, help='K-mer size')  
-    parser.add_argument('--error', type=float, default=0.05, help='Error rate (0.0-1.0)')
-    parser.add_argument('--error_threshold', type=float, default=0.15, help='Error threshold for adaptive strategy')
-    parser.add_argument('--trials', type=int, default=1, help='Number of test trials')
-    
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
     
     # Validate parameters
     if args.length < args.k:
@@ -162,7 +210,7 @@ def main():
         print(f"Error: Number of trials must be >= 1")
         return
     
-    run_comparison_test(args.length, args.k, args.error, args.error_threshold, args.trials)
+    run_comparison_test(args.length, args.k, args.error, args.error_threshold, args.trials, args.workers)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
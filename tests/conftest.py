@@ -0,0 +1,27 @@
+import pytest
+from src.algorithms.classic_sbh import ClassicSBH
+from src.benchmarking.benchmark_sbh import SBHBenchmark
+from src.generators.dna_generator import DNAGenerator
+from src.generators.spectrum_generator import SpectrumGenerator
+
+# The generators and ClassicSBH keep no state between calls, so one instance serves the whole session
+
+@pytest.fixture(scope="session")
+def classic_sbh():
+    """Shared ClassicSBH instance"""
+    return ClassicSBH()
+
+@pytest.fixture(scope="session")
+def dna_gen():
+    """Shared DNA generator"""
+    return DNAGenerator()
+
+@pytest.fixture(scope="session")
+def spectrum_gen():
+    """Shared spectrum generator"""
+    return SpectrumGenerator()
+
+@pytest.fixture(scope="session")
+def sbh_benchmark():
+    """Shared SBH benchmark runner"""
+    return SBHBenchmark()
@@ -0,0 +1,32 @@
+import pytest
+from src.algorithms._kmer_codec import (
+    GAP_CODE, MAX_K, decode, distinct_bases, encode, encode_array, prefix, suffix
+)
+
+def test_encode_decode_roundtrip():
+    """Test that decoding an encoded k-mer gives back the k-mer"""
+    for kmer in ['A', 'ACGT', 'TTTTGGGGCCCCAAAA', 'T' * MAX_K]:
+        assert decode(encode(kmer), len(kmer)) == kmer
+
+def test_prefix_and_suffix():
+    """Test that prefix/suffix codes match the codes of the sliced k-mer"""
+    code = encode('ACGTA')
+    assert prefix(code, 5) == encode('ACGT')
+    assert suffix(code, 5) == encode('CGTA')
+
+def test_encode_array_matches_encode():
+    """Test vectorized encoding against the scalar encoder"""
+    kmers = ['ACGTAC', 'TTTTTT', 'GATTAC', 'ACGNAC']
+    codes = encode_array(kmers, 6)
+    assert codes.tolist() == [encode(kmer) for kmer in kmers]
+    assert codes[-1] == GAP_CODE
+
+def test_encode_array_rejects_long_kmers():
+    """Test that k-mers too long for uint64 codes are rejected"""
+    with pytest.raises(ValueError):
+        encode_array(['A' * (MAX_K + 1)], MAX_K + 1)
+
+def test_distinct_bases():
+    """Test distinct base counts computed from codes"""
+    kmers = ['AAAAAA', 'ACACAC', 'ACGACG', 'ACGTTT']
+    assert distinct_bases(encode_array(kmers, 6), 6).tolist() == [1, 2, 3, 4]
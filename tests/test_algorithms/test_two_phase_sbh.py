@@ -0,0 +1,74 @@
+from src.algorithms._kmer_codec import encode
+from src.algorithms.two_phase_sbh import ContigArrays, ThreePhaseSBH
+
+def _prepared_sbh(spectrum, k):
+    """ThreePhaseSBH with its spectrum indices built and every k-mer available"""
+    sbh = ThreePhaseSBH()
+    sbh.reconstruct(spectrum, len(spectrum) + k - 1, k)
+    available_kmers = set(spectrum)
+    sbh._init_rescue_arrays(available_kmers)
+    return sbh, available_kmers
+
+def test_aggressive_jump_respects_candidate_size():
+    """Test that a non-positive candidate_size keeps the aggressive jump from picking anything"""
+    spectrum = ['ACGT', 'CGTA', 'GTAC', 'TACG']
+    for candidate_size, expected in [(-1, None), (0, None), (1, 'TACG'), (10, 'TACG')]:
+        sbh, available_kmers = _prepared_sbh(spectrum, 4)
+        sbh.candidate_size = candidate_size
+        assert sbh._find_aggressive_jump('CGT', available_kmers, 4) == expected
+    
+    sbh, _ = _prepared_sbh(spectrum, 4)
+    assert sbh._find_aggressive_jump('CGT', set(), 4) is None
+
+def test_perfect_reconstruction(spectrum_gen):
+    """Test that an error-free spectrum of a repeat-free sequence is reconstructed exactly"""
+    original_dna = "ATGGCGTACCTAGCTTGACA"
+    k = 5
+    spectrum = spectrum_gen.generate(original_dna, k)
+    
+    assert ThreePhaseSBH().reconstruct(spectrum, len(original_dna), k) == original_dna
+
+def test_reconstruction_with_errors(dna_gen, spectrum_gen):
+    """Test that a noisy spectrum still yields a full-length sequence of bases and gap markers"""
+    original_dna = dna_gen.generate(200)
+    k = 8
+    spectrum = spectrum_gen.generate(original_dna, k, negative_error_rate=0.05, positive_error_rate=0.05)
+    
+    reconstructed_dna = ThreePhaseSBH().reconstruct(spectrum, len(original_dna), k)
+    
+    assert len(reconstructed_dna) == len(original_dna)
+    assert set(reconstructed_dna) <= set('ACGTN')
+
+def test_longest_suffix_prefix_overlap():
+    """Test suffix/prefix overlap lengths, including the no-overlap and full-overlap cases"""
+    sbh = ThreePhaseSBH()
+    
+    assert sbh._longest_suffix_prefix_overlap('AACGT', 'CGTTA', 4) == 3
+    assert sbh._longest_suffix_prefix_overlap('AAAA', 'AAAC', 3) == 3  # Longest wins over shorter repeats
+    assert sbh._longest_suffix_prefix_overlap('ACGT', 'ACGT', 4) == 4  # Full overlap
+    assert sbh._longest_suffix_prefix_overlap('ACGT', 'ACGT', 3) == 0  # Limited by max_len
+    assert sbh._longest_suffix_prefix_overlap('ACGT', 'GGGG', 4) == 0  # No overlap
+    assert sbh._longest_suffix_prefix_overlap('ACGT', '', 4) == 0
+    assert sbh._longest_suffix_prefix_overlap('', 'ACGT', 4) == 0
+    assert sbh._longest_suffix_prefix_overlap('ACGT', 'TA', 0) == 0
+
+def test_connect_contigs():
+    """Test that contigs are joined by confidence through their overlaps"""
+    sbh = ThreePhaseSBH()
+    sbh._used_kmers = set()
+    k = 4
+    records = [
+        (contig, confidence, [encode(contig[i:i + k]) for i in range(len(contig) - k + 1)])
+        for contig, confidence in [('TACGGA', 0.6), ('ACGTAC', 0.8), ('GGGGGG', 0.7)]
+    ]
+    contigs = ContigArrays.from_records(records)
+    
+    # The best contig comes first, the one without an overlap is left out
+    assert sbh._connect_contigs(contigs, [], k, 20) == 'ACGTACGGA'
+    assert sbh._used_kmers == {code for contig, _, codes in records[:2] for code in codes}
+    
+    # Connecting stops once the target length is reached
+    sbh._used_kmers = set()
+    assert sbh._connect_contigs(contigs, [], k, 6) == 'ACGTAC'
+    
+    assert sbh._connect_contigs(ContigArrays.from_records([]), [], k, 20) == ''
@@ -1,9 +1,8 @@
 import pytest
-from src.benchmarking.benchmark_sbh import SBHBenchmark, BenchmarkParameters
+from src.benchmarking.benchmark_sbh import BenchmarkParameters
 
-def test_benchmark_perfect_reconstruction():
+def test_benchmark_perfect_reconstruction(sbh_benchmark):
     """Test benchmarking with perfect reconstruction"""
-    benchmark = SBHBenchmark()
     params = BenchmarkParameters(
         sequence_length=100,
         k_mer_length=8,
@@ -12,7 +11,7 @@ def test_benchmark_perfect_reconstruction():
         num_trials=3
     )
     
-    result = benchmark.run_benchmark(params)
+    result = sbh_benchmark.run_benchmark(params)
     
     assert result.avg_reconstruction_accuracy > 0.9  # Should be near perfect
     assert result.avg_execution_time > 0
@@ -20,9 +19,8 @@ def test_benchmark_perfect_reconstruction():
     assert result.std_execution_time >= 0
     assert result.successful_reconstructions > 0
 
-def test_benchmark_with_errors():
+def test_benchmark_with_errors(sbh_benchmark):
     """Test benchmarking with error rates"""
-    benchmark = SBHBenchmark()
     params = BenchmarkParameters(
         sequence_length=100,
         k_mer_length=8,
@@ -31,62 +29,36 @@ def test_benchmark_with_errors():
         num_trials=3
     )
     
-    result = benchmark.run_benchmark(params)
+    result = sbh_benchmark.run_benchmark(params)
     
     assert 0 <= result.avg_reconstruction_accuracy <= 1
     assert result.avg_execution_time > 0
     assert result.std_reconstruction_accuracy >= 0
     assert result.std_execution_time >= 0
 
-def test_invalid_parameters():
-    """Test benchmarking with invalid parameters"""
-    benchmark = SBHBenchmark()
-    
+@pytest.mark.parametrize("params_kwargs", [
     # Invalid sequence length
-    with pytest.raises(ValueError):
-        params = BenchmarkParameters(
-            sequence_length=0,
-            k_mer_length=8,
-            negative_error_rate=0.0,
-            positive_error_rate=0.0,
-            num_trials=3
-        )
-        benchmark.run_benchmark(params)
-    
+    dict(sequence_length=0, k_mer_length=8, negative_error_rate=0.0, positive_error_rate=0.0, num_trials=3),
     # Invalid k-mer length
+    dict(sequence_length=100, k_mer_length=0, negative_error_rate=0.0, positive_error_rate=0.0, num_trials=3),
+    # Invalid error rate (> 1)
+    dict(sequence_length=100, k_mer_length=8, negative_error_rate=1.5, positive_error_rate=0.0, num_trials=3),
+])
+def test_invalid_parameters(sbh_benchmark, params_kwargs):
+    """Test benchmarking with invalid parameters"""
     with pytest.raises(ValueError):
-        params = BenchmarkParameters(
-            sequence_length=100,
-            k_mer_length=0,
-            negative_error_rate=0.0,
-            positive_error_rate=0.0,
-            num_trials=3
-        )
-        benchmark.run_benchmark(params)
-    
-    # Invalid error rate
-    with pytest.raises(ValueError):
-        params = BenchmarkParameters(
-            sequence_length=100,
-            k_mer_length=8,
-            negative_error_rate=1.5,  # > 1
-            positive_error_rate=0.0,
-            num_trials=3
-        )
-        benchmark.run_benchmark(params)
+        sbh_benchmark.run_benchmark(BenchmarkParameters(**params_kwargs))
 
-def test_accuracy_calculation():
+def test_accuracy_calculation(sbh_benchmark):
     """Test accuracy calculation"""
-    benchmark = SBHBenchmark()
-    
     # Perfect match
-    assert benchmark._calculate_accuracy("ACGT", "ACGT") == 1.0
+    assert sbh_benchmark._calculate_accuracy("ACGT", "ACGT") == 1.0
     
     # No match
-    assert benchmark._calculate_accuracy("AAAA", "TTTT") == 0.0
+    assert sbh_benchmark._calculate_accuracy("AAAA", "TTTT") == 0.0
     
     # Partial match
-    assert benchmark._calculate_accuracy("ACGT", "ACTT") == 0.75
+    assert sbh_benchmark._calculate_accuracy("ACGT", "ACTT") == 0.75
     
     # Different lengths
-    assert benchmark._calculate_accuracy("ACGT", "ACG") == 0.0 
\ No newline at end of file
+    assert sbh_benchmark._calculate_accuracy("ACGT", "ACG") == 0.0 
\ No newline at end of file
@@ -1,31 +1,44 @@
 import pytest
-from src.generators.dna_generator import DNAGenerator
+import numpy as np
 
-def test_dna_generator_length():
+# Byte values of the valid nucleotides, checked against encoded sequences in one pass
+_ACGT = frozenset(b'ACGT')
+
+def test_dna_generator_length(dna_gen):
     """Test if generated DNA has correct length"""
     length = 300
-    generator = DNAGenerator()
-    dna = generator.generate(length)
+    dna = dna_gen.generate(length)
     assert len(dna) == length
 
-def test_dna_generator_valid_nucleotides():
+def test_dna_generator_valid_nucleotides(dna_gen):
     """Test if generated DNA contains only valid nucleotides"""
-    generator = DNAGenerator()
-    dna = generator.generate(100)
-    valid_nucleotides = set('ACGT')
-    assert all(n in valid_nucleotides for n in dna)
+    dna = dna_gen.generate(100)
+    assert _ACGT.issuperset(dna.encode())
 
-def test_dna_generator_random():
+def test_dna_generator_random(dna_gen):
     """Test if generator produces different sequences"""
-    generator = DNAGenerator()
-    dna1 = generator.generate(100)
-    dna2 = generator.generate(100)
-    assert dna1 != dna2  # Very unlikely to be equal if truly random
+    dna1 = dna_gen.generate(100, rng=np.random.default_rng(1))
+    dna2 = dna_gen.generate(100, rng=np.random.default_rng(2))
+    assert dna1 != dna2
+
+def test_dna_generator_seeded(dna_gen):
+    """Test if the same seed reproduces the same sequence"""
+    dna1 = dna_gen.generate(100, rng=np.random.default_rng(42))
+    dna2 = dna_gen.generate(100, rng=np.random.default_rng(42))
+    assert dna1 == dna2
 
-def test_dna_generator_invalid_length():
+def test_dna_generator_invalid_length(dna_gen):
     """Test if generator raises error for invalid length"""
-    generator = DNAGenerator()
     with pytest.raises(ValueError):
-        generator.generate(-1)
+        dna_gen.generate(-1)
     with pytest.raises(ValueError):
-        generator.generate(0) 
\ No newline at end of file
+        dna_gen.generate(0)
+
+
+def test_dna_generator_batch(dna_gen):
+    """Test if batch generation returns the requested number of valid sequences"""
+    sequences = dna_gen.generate_batch(5, 12)
+    assert len(sequences) == 5
+    assert all(len(dna) == 12 for dna in sequences)
+    assert all(_ACGT.issuperset(dna.encode()) for dna in sequences)
+    assert dna_gen.generate_batch(0, 12) == []
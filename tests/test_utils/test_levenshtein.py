@@ -0,0 +1,34 @@
+import random
+from src.utils.levenshtein import _myers_distance, levenshtein_distance, levenshtein_similarity
+
+def _dp_distance(s1, s2):
+    """Reference Levenshtein distance from the plain dynamic programming table"""
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (c1 != c2)))
+        previous = current
+    return previous[-1]
+
+def test_myers_matches_dp():
+    """Test the bit-parallel distance against the DP on random strings, including ones past 64 bases"""
+    rng = random.Random(0)
+    for _ in range(300):
+        s1 = ''.join(rng.choice('ACGT') for _ in range(rng.randint(0, 150)))
+        s2 = ''.join(rng.choice('ACGTN') for _ in range(rng.randint(0, 150)))
+        assert _myers_distance(s1, s2) == _dp_distance(s1, s2)
+
+def test_distance_edge_cases():
+    """Test empty strings, identical strings and word-boundary lengths"""
+    for s1, s2 in [('', ''), ('', 'ACGT'), ('ACGT', ''), ('ACGT', 'ACGT'),
+                   ('A' * 64, 'A' * 63 + 'C'), ('A' * 65, 'C' * 64), ('ACGT' * 40, 'TGCA' * 33)]:
+        assert _myers_distance(s1, s2) == _dp_distance(s1, s2)
+        assert levenshtein_distance(s1, s2) == _dp_distance(s1, s2)
+
+def test_similarity():
+    """Test similarity percentages"""
+    assert levenshtein_similarity('', '') == 100.0
+    assert levenshtein_similarity('ACGT', 'ACGT') == 100.0
+    assert levenshtein_similarity('ACGT', 'ACGA') == 75.0
+    assert levenshtein_similarity('ACGT', '') == 0.0
@@ -0,0 +1,22 @@
+from src.utils.sequence_validator import SequenceValidator
+
+def test_exact_reconstruction():
+    """Test that a reconstruction containing every k-mer is valid with full coverage"""
+    spectrum = frozenset(['ACG', 'CGT', 'GTA', 'TAC'])
+    assert SequenceValidator().validate_reconstruction('ACGTACGT', spectrum, 3) == (True, 100.0)
+
+def test_partial_reconstruction():
+    """Test coverage when only some original k-mers are reconstructed"""
+    spectrum = ['ACG', 'CGT', 'GTA', 'TAC']
+    assert SequenceValidator().validate_reconstruction('ACGT', spectrum, 3) == (False, 50.0)
+
+def test_mixed_length_spectrum():
+    """Test that k-mers of the wrong length never match, even when total length fits"""
+    is_valid, coverage = SequenceValidator().validate_reconstruction('ACACGT', ['AC', 'ACGT'], 3)
+    assert not is_valid
+    assert coverage == 0.0
+
+def test_non_acgt_spectrum():
+    """Test the unpacked path for spectra with symbols outside ACGT"""
+    spectrum = ['ACN', 'CNT']
+    assert SequenceValidator().validate_reconstruction('ACNT', spectrum, 3) == (True, 100.0)